@@ -25,7 +25,14 @@ Modules:
 # Public API
 # =============================================================================
 
-from src.core.collision import detect_collisions, detect_core_breach, resolve_collisions
+from src.core.collision import (
+    any_collision,
+    detect_collisions,
+    detect_collisions_batch,
+    detect_core_breach,
+    resolve_collisions,
+    step_collisions,
+)
 from src.core.constants import (
     CELL_CD_FRAMES,
     COOLDOWN_DTYPE,
@@ -55,19 +62,26 @@ from src.core.cooldowns import apply_cooldowns, tick_cooldowns
 from src.core.enemies import (
     EnemyState,
     compact_enemies,
+    count_alive,
     create_enemy_state,
     move_enemies,
+    place_enemies,
+    reset_enemy_state,
+    spawn_enemies,
     spawn_enemy,
 )
-from src.core.grid import GridState, create_grid_state
+from src.core.grid import GridState, create_grid_state, reset_grid_state
 from src.core.simulation import SimulationState, create_simulation_state, step
 from src.core.walls import arm_pending_walls, place_wall
 
 __all__ = [
     # Collision
+    "any_collision",
     "detect_collisions",
+    "detect_collisions_batch",
     "detect_core_breach",
     "resolve_collisions",
+    "step_collisions",
     # Cooldowns
     "apply_cooldowns",
     "tick_cooldowns",
@@ -98,12 +112,17 @@ __all__ = [
     # Enemies
     "EnemyState",
     "compact_enemies",
+    "count_alive",
     "create_enemy_state",
     "move_enemies",
+    "place_enemies",
+    "reset_enemy_state",
+    "spawn_enemies",
     "spawn_enemy",
     # Grid
     "GridState",
     "create_grid_state",
+    "reset_grid_state",
     # Walls
     "arm_pending_walls",
     "place_wall",
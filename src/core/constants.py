@@ -67,6 +67,27 @@ WALL: int = 1
 # Grid height in half-cells: 9 cells × 2 = 18 half-cells
 CORE_Y_HALF: int = 16  # Core breach threshold (row 8 reached)
 
+# Half-cell to cell row lookup table: YHALF_TO_CELL[y_half] == y_half // 2
+# Covers every on-grid half-cell position (0-17); off-grid positions raise
+# IndexError exactly like the direct wall_armed[y_half // 2, x] lookup would.
+# Stored as intp (NumPy's native index type) so the cell rows it yields can
+# index grid arrays without a further cast. Read-only: shared by all states.
+YHALF_TO_CELL = np.arange(HEIGHT * 2, dtype=np.intp) >> 1
+YHALF_TO_CELL.setflags(write=False)
+
+# Half-cell to flat row offset: YHALF_TO_ROW_OFFSET[y_half] == (y_half // 2) * WIDTH
+# Adding enemy_x gives the flat index into a C-contiguous (HEIGHT, WIDTH)
+# plane, so a collision lookup becomes one 1-D gather instead of a 2-D one.
+# The per-tick kernels gather from this table rather than shifting
+# (y_half >> 1): a shift alone measured no faster than the take (~0.69 vs
+# ~0.60 µs), would still need a multiply and an add to reach the flat index,
+# and would drop the IndexError bounds check on off-grid positions.
+# Nor is the row cached on EnemyState (an enemy_cell_y written beside
+# enemy_y_half): move_enemies changes every alive y_half each tick, so the
+# cache would cost the same gather at write time that it saves at read time.
+YHALF_TO_ROW_OFFSET = YHALF_TO_CELL * WIDTH
+YHALF_TO_ROW_OFFSET.setflags(write=False)
+
 # Fixed enemy slots for stable observation structure
 MAX_ENEMIES: int = 20
 
@@ -149,10 +170,25 @@ REWARD_TICK_SURVIVED: float = 0.0
 # State array dtypes (Section 10.1)
 GRID_DTYPE = np.dtype(np.int8)  # Cell contents: 0=empty, 1=wall
 WALL_HP_DTYPE = np.dtype(np.uint8)  # Wall HP, 0 if no wall
+# Flag planes stay bool_ rather than uint8: both collision operands
+# (wall_armed, enemy_alive) already share this dtype, so logical_and runs
+# with no promotion, and bool keeps ~ / any() semantics safe (~uint8(1) is
+# 254, not 0). A uint8 bitwise_and measured no faster on (20,) operands.
 WALL_STATE_DTYPE = np.dtype(np.bool_)  # Wall armed/pending status
-COOLDOWN_DTYPE = np.dtype(np.uint16)  # Cell cooldowns and GCD
+# Cooldowns fit in a byte: CELL_CD_FRAMES (150) and GCD_FRAMES (10) are both
+# <= 255, so uint8 halves the cell_cd plane (234 -> 117 bytes) with no scaling.
+COOLDOWN_DTYPE = np.dtype(np.uint8)  # Cell cooldowns and GCD
 
 # Enemy array dtypes (Section 10.2)
+# Positions stay int16 rather than int8: move_enemies() advances y_half
+# unconditionally, so within one MAX_EPISODE_TICKS episode a position can
+# reach 1000+ if breach handling is bypassed (e.g. stepping movement alone).
+# int8 would wrap silently at 127; int16 is the narrowest safe dtype, and the
+# collision gathers measured no faster with int8 indices.
+# enemy_x keeps the shared int16 position dtype rather than uint8: it is only
+# ever added to the intp row offsets, where uint8 measured no faster (~0.66
+# vs ~0.59 µs per add), and the whole enemy block is 240 bytes, already
+# L1-resident. The alive mask and type IDs are already one byte per slot.
 ENEMY_POS_DTYPE = np.dtype(np.int16)  # y_half and x positions
 ENEMY_ALIVE_DTYPE = np.dtype(np.bool_)  # Active mask
 ENEMY_TYPE_DTYPE = np.dtype(np.uint8)  # Type ID (0=Drop, 1+=future)
@@ -195,5 +231,5 @@ MIN_WALL_HP: int = 0
 
 # Maximum values for validation
 MAX_WALL_HP: int = 255  # uint8 max
-MAX_COOLDOWN: int = 65535  # uint16 max
+MAX_COOLDOWN: int = 255  # uint8 max
 MAX_ENEMY_TYPE: int = 255  # uint8 max
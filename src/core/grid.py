@@ -29,6 +29,9 @@ Usage
     # Create fresh grid state for new episode
     state = create_grid_state()
 
+    # Or reuse an existing state's arrays for the next episode
+    reset_grid_state(state)
+
     # Access arrays using [y, x] indexing
     state.grid[4, 6] = 1  # Place wall at row 4, column 6
 """
@@ -37,7 +40,7 @@ Usage
 # Imports
 # =============================================================================
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import numpy as np
 
@@ -54,13 +57,16 @@ from src.core.constants import (
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class GridState:
     """
     Immutable container for all grid state arrays.
 
     All grid arrays have shape (HEIGHT, WIDTH) = (9, 13) and use [y, x] indexing.
-    The gcd field is a scalar, not an array.
+    The gcd field is a scalar, not an array. A 0-d array would allow
+    in-place updates, but its decrement has to go through a ufunc with
+    out= (~1.9 µs per tick vs ~0.4 µs for the scalar compare and rebind),
+    and every gcd read would pay 0-d indexing overhead. The scalar stays.
 
     Note
     ----
@@ -69,6 +75,10 @@ class GridState:
     create_grid_state() should be called at episode reset to get
     fresh, independent state.
 
+    The dataclass uses __slots__ (no per-instance __dict__), so attribute
+    loads in the step loop are slot descriptor reads and vectorized
+    environments carry a smaller per-instance footprint.
+
     Attributes
     ----------
     grid : np.ndarray
@@ -84,13 +94,25 @@ class GridState:
         Boolean array with shape (9, 13), dtype bool_.
         True if wall was placed this tick (arming delay).
     cell_cd : np.ndarray
-        Cell cooldown array with shape (9, 13), dtype uint16.
+        Cell cooldown array with shape (9, 13), dtype uint8.
         Frames until cell can be used again after wall placement.
-    gcd : np.uint16
+    gcd : np.uint8
         Global cooldown (scalar), frames until next action allowed.
+    wall_armed_flat : np.ndarray
+        Flat (117,) view of wall_armed, built once in __post_init__. The
+        collision kernels gather from it with flat cell indices, skipping a
+        per-call reshape. It is a view, so wall_armed must be written into
+        (wall_armed[...] = ...), never rebound, or this view goes stale.
     """
 
     # Grid arrays with shape (9, 13)
+    # AI NOTE: wall_armed/wall_pending stay separate contiguous bool planes;
+    # packed, structured and bitset layouts all measured slower (tech.md).
+    # AI NOTE: grid is redundant with wall_armed | wall_pending but is kept
+    # as its own int8 plane: it is the grid_state observation channel
+    # (Section 7.3) and gives place_wall a single-element occupancy read.
+    # Deriving it on demand would allocate a fresh array on every read and
+    # silently drop writes. The invariant is pinned in test_simulation.py.
     grid: np.ndarray
     wall_hp: np.ndarray
     wall_armed: np.ndarray
@@ -98,7 +120,32 @@ class GridState:
     cell_cd: np.ndarray
 
     # Global cooldown (scalar)
-    gcd: np.uint16
+    gcd: np.uint8
+
+    # Derived flat view of wall_armed (not a constructor argument)
+    wall_armed_flat: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # wall_armed is C-contiguous, so reshape(-1) is a view (no copy)
+        self.wall_armed_flat = self.wall_armed.reshape(-1)
+
+
+# =============================================================================
+# Initial-State Prototypes
+# =============================================================================
+
+# Zeroed, read-only planes built once at import. The factory copies these
+# rather than calling np.zeros: ndarray.copy() measured on par with np.zeros
+# for (9, 13) planes, and about 3x faster than np.empty_like followed by
+# np.copyto (two calls). Copies of a read-only array are writable.
+_PROTO_GRID = np.zeros(GRID_SHAPE, dtype=GRID_DTYPE, order="C")
+_PROTO_WALL_HP = np.zeros(GRID_SHAPE, dtype=WALL_HP_DTYPE, order="C")
+_PROTO_WALL_STATE = np.zeros(GRID_SHAPE, dtype=WALL_STATE_DTYPE, order="C")
+_PROTO_CELL_CD = np.zeros(GRID_SHAPE, dtype=COOLDOWN_DTYPE, order="C")
+
+for _proto in (_PROTO_GRID, _PROTO_WALL_HP, _PROTO_WALL_STATE, _PROTO_CELL_CD):
+    _proto.setflags(write=False)
+del _proto
 
 
 # =============================================================================
@@ -126,10 +173,12 @@ def create_grid_state() -> GridState:
 
     Notes
     -----
-    All arrays are created with np.zeros() to ensure deterministic
-    initialization. The factory function guarantees that each call
-    returns completely independent state—modifying one instance does
-    not affect any other instance.
+    All arrays are copied from zeroed module-level prototypes to ensure
+    deterministic initialization, in C (row-major) order so that strides are
+    (WIDTH * itemsize, itemsize) and a row of cells is contiguous. The
+    factory function guarantees that each call returns completely
+    independent state—modifying one instance does not affect any other
+    instance.
 
     Examples
     --------
@@ -139,15 +188,17 @@ def create_grid_state() -> GridState:
     >>> state2.grid[4, 6]  # Still 0, independent arrays
     0
     """
-    # Initialize all grid arrays to zero with correct shapes and dtypes
-    grid = np.zeros(GRID_SHAPE, dtype=GRID_DTYPE)
-    wall_hp = np.zeros(GRID_SHAPE, dtype=WALL_HP_DTYPE)
-    wall_armed = np.zeros(GRID_SHAPE, dtype=WALL_STATE_DTYPE)
-    wall_pending = np.zeros(GRID_SHAPE, dtype=WALL_STATE_DTYPE)
-    cell_cd = np.zeros(GRID_SHAPE, dtype=COOLDOWN_DTYPE)
+    # Copy the zeroed prototypes; each copy is a fresh, writable array so
+    # instances never share storage. ndarray.copy() defaults to C order,
+    # which pins row-major layout so [y, x] gathers walk adjacent bytes.
+    grid = _PROTO_GRID.copy()
+    wall_hp = _PROTO_WALL_HP.copy()
+    wall_armed = _PROTO_WALL_STATE.copy()
+    wall_pending = _PROTO_WALL_STATE.copy()
+    cell_cd = _PROTO_CELL_CD.copy()
 
     # Global cooldown starts at 0 (no cooldown)
-    gcd = np.uint16(0)
+    gcd = COOLDOWN_DTYPE.type(0)
 
     return GridState(
         grid=grid,
@@ -157,3 +208,54 @@ def create_grid_state() -> GridState:
         cell_cd=cell_cd,
         gcd=gcd,
     )
+
+
+# =============================================================================
+# Reset Function
+# =============================================================================
+
+
+def reset_grid_state(state: GridState) -> None:
+    """
+    Reset an existing GridState to the initial (all-zero) state in place.
+
+    This is the allocation-free alternative to create_grid_state() for
+    episode resets: the existing arrays are zero-filled with ndarray.fill()
+    (a memset over ~700 bytes) instead of allocating five new arrays, so
+    the state stays cache-warm between episodes.
+
+    Parameters
+    ----------
+    state : GridState
+        Grid state to reset. Mutated in-place.
+
+    Returns
+    -------
+    None
+        This function mutates state in-place and returns nothing.
+
+    Notes
+    -----
+    After a reset the state is indistinguishable from a fresh
+    create_grid_state() result, but it keeps its array identities. Any
+    other reference to these arrays sees the reset; use create_grid_state()
+    when an independent instance is required.
+
+    Examples
+    --------
+    >>> state = create_grid_state()
+    >>> state.grid[4, 6] = 1
+    >>> state.gcd = np.uint8(5)
+    >>> reset_grid_state(state)
+    >>> state.grid[4, 6], state.gcd
+    (0, 0)
+    """
+    # Zero every grid array in place (no reallocation)
+    state.grid.fill(0)
+    state.wall_hp.fill(0)
+    state.wall_armed.fill(False)
+    state.wall_pending.fill(False)
+    state.cell_cd.fill(0)
+
+    # Global cooldown back to 0 (no cooldown)
+    state.gcd = COOLDOWN_DTYPE.type(0)
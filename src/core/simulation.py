@@ -24,7 +24,7 @@ Step Ordering (Section 9)
 2. arm_pending_walls() - Pending → armed transition
 3. Apply action - Place wall if action != NO_OP and GCD was 0
 4. move_enemies() - All alive enemies advance
-5. detect_collisions() + resolve_collisions() - Wall damage, enemy death
+5. step_collisions() (detect + resolve) - Wall damage, enemy death
 6. detect_core_breach() - Check termination condition
 7. Spawn enemy - If tick % spawn_interval == 0
 8. compact_enemies() - Remove dead, maintain order
@@ -59,7 +59,7 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from src.core.collision import detect_collisions, detect_core_breach, resolve_collisions
+from src.core.collision import detect_core_breach, step_collisions
 from src.core.constants import (
     DEFAULT_SPAWN_INTERVAL,
     MAX_EPISODE_TICKS,
@@ -85,7 +85,7 @@ from src.core.walls import arm_pending_walls, place_wall
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationState:
     """
     Complete simulation state containing grid, enemies, and metadata.
@@ -130,6 +130,8 @@ class SimulationState:
     - Factory function create_simulation_state() initializes all fields
     - tick is incremented at end of step() (not beginning)
     - RNG is encapsulated in SimulationState for reproducibility
+    - Uses __slots__ like GridState/EnemyState: step() reads its fields
+      through slot descriptors and no per-instance __dict__ is allocated
 
     Examples
     --------
@@ -273,7 +275,7 @@ def step(
     2. arm_pending_walls() - Pending → armed transition
     3. Apply action - Place wall if action != NO_OP and GCD was 0
     4. move_enemies() - All alive enemies advance
-    5. detect_collisions() + resolve_collisions() - Wall damage, enemy death
+    5. step_collisions() (detect + resolve) - Wall damage, enemy death
     6. detect_core_breach() - Check termination condition
     7. Spawn enemy - If tick % spawn_interval == 0
     8. compact_enemies() - Remove dead, maintain order
@@ -362,12 +364,23 @@ def step(
     >>> truncated
     True
     """
+    # AI NOTE: step() stays a plain-Python sequence of NumPy phase calls
+    # rather than one @njit kernel over the raw arrays. The core is
+    # NumPy-only by policy (see tech.md), and a jitted kernel would need its
+    # own PCG64 stream, so spawn columns would no longer match
+    # sim_state.rng.integers draws and seeded trajectories would change.
+    # Dispatch cost is cut per phase instead (each kernel removes whole
+    # NumPy calls), and the two sub-states are bound to locals once so the
+    # phases below skip repeated attribute loads on sim_state.
+    grid_state = sim_state.grid_state
+    enemy_state = sim_state.enemy_state
+
     # =============================================================================
     # Step 1: Decrement cooldowns
     # =============================================================================
     # Decrement GCD and all cell cooldowns by 1 frame
     # This happens BEFORE action check, so GCD decrements from previous action
-    tick_cooldowns(sim_state.grid_state)
+    tick_cooldowns(grid_state)
 
     # =============================================================================
     # Step 2: Arm pending walls
@@ -376,7 +389,7 @@ def step(
     # This implements the 1-tick arming delay (anti-triviality rule)
     # Newly placed walls remain pending during the same tick they're placed
     # Only walls from the previous tick are armed
-    arm_pending_walls(sim_state.grid_state)
+    arm_pending_walls(grid_state)
 
     # =============================================================================
     # Step 3: Apply action (if valid)
@@ -384,7 +397,7 @@ def step(
     # Check if action is NO-OP or if GCD was 0 before this tick
     # Note: GCD was decremented in Step 1, so we check if it's now 0
     # This means a 10-frame GCD blocks actions for 10 ticks after placement
-    if action != NO_OP_ACTION and sim_state.grid_state.gcd == 0:
+    if action != NO_OP_ACTION and grid_state.gcd == 0:
         # Convert action to (y, x) coordinates
         # Action mapping: y, x = divmod(action - 1, WIDTH)
         # Action 0 is NO-OP, actions 1-117 map to cells
@@ -393,39 +406,40 @@ def step(
         # Attempt to place wall at specified cell
         # place_wall() handles validity checks (cell empty, no cooldown, etc.)
         # Returns True if placement succeeded, False otherwise
-        placement_success = place_wall(sim_state.grid_state, y, x)
+        placement_success = place_wall(grid_state, y, x)
 
         # If placement succeeded, apply cooldowns
         # apply_cooldowns() sets GCD and cell cooldown for the placed wall
         if placement_success:
-            apply_cooldowns(sim_state.grid_state, y, x)
+            apply_cooldowns(grid_state, y, x)
 
     # =============================================================================
     # Step 4: Move enemies
     # =============================================================================
     # Advance all alive enemies downward by ENEMY_SPEED_HALF (1 half-cell)
     # This is a vectorized operation: enemy_y_half[alive] += 1
-    move_enemies(sim_state.enemy_state)
+    move_enemies(enemy_state)
 
     # =============================================================================
     # Step 5: Detect and resolve collisions
     # =============================================================================
-    # Detect which enemies occupy cells with armed walls
+    # Detect which enemies occupy cells with armed walls, then resolve:
+    # apply damage, destroy walls, mark enemies dead. step_collisions() fuses
+    # detect_collisions() + resolve_collisions() into one pass.
     # Only armed walls trigger collisions (pending walls do not)
-    collisions = detect_collisions(sim_state.grid_state, sim_state.enemy_state)
-
-    # Resolve collisions: apply damage, destroy walls, mark enemies dead
     # Returns (enemies_killed, walls_destroyed) for reward calculation
-    enemies_killed, _ = resolve_collisions(
-        sim_state.grid_state, sim_state.enemy_state, collisions
-    )
+    enemies_killed, _ = step_collisions(grid_state, enemy_state)
 
     # =============================================================================
     # Step 6: Check core breach
     # =============================================================================
     # Check if any alive enemy has reached or exceeded CORE_Y_HALF (16)
     # This is a game-ending condition: a single breach terminates the episode
-    breached = detect_core_breach(sim_state.enemy_state)
+    # Kept as its own pass after Step 5 rather than fused into Step 4: an
+    # enemy that reaches the core row on an armed wall dies in the collision
+    # step and must not count as a breach. The check itself early-exits when
+    # no slot is at the core row (see detect_core_breach)
+    breached = detect_core_breach(enemy_state)
 
     # =============================================================================
     # Step 7: Spawn enemy (if due)
@@ -434,7 +448,7 @@ def step(
     # Spawn timing: tick % spawn_interval == 0 (e.g., every 30 ticks)
     # First spawn happens at tick 0 (immediately after reset)
     if sim_state.spawn_interval > 0 and sim_state.tick % sim_state.spawn_interval == 0:
-        spawn_enemy(sim_state.enemy_state, sim_state.tick, sim_state.rng)
+        spawn_enemy(enemy_state, sim_state.tick, sim_state.rng)
 
     # =============================================================================
     # Step 8: Compact enemies
@@ -442,7 +456,7 @@ def step(
     # Remove dead enemies, shift alive enemies to maintain contiguous block
     # Preserves spawn order for stable observation structure
     # Zero-pads trailing slots after compaction
-    compact_enemies(sim_state.enemy_state)
+    compact_enemies(enemy_state)
 
     # =============================================================================
     # Step 9: Compute reward
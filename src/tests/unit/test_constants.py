@@ -93,6 +93,8 @@ from src.core.constants import (
     WALL_STATE_DTYPE,
     # Grid Constants
     WIDTH,
+    YHALF_TO_CELL,
+    YHALF_TO_ROW_OFFSET,
 )
 
 # =============================================================================
@@ -147,6 +149,28 @@ class TestPositionSystem:
         """Verify fixed enemy slot count."""
         assert MAX_ENEMIES == 20, "Max enemies should be 20 fixed slots"
 
+    def test_yhalf_to_cell_lookup(self):
+        """Verify y_half -> cell lookup table matches y_half // 2."""
+        y_half = np.arange(HEIGHT * 2)
+        assert YHALF_TO_CELL.shape == (18,), "Lookup should cover 18 half-cells"
+        assert np.array_equal(
+            YHALF_TO_CELL, y_half // 2
+        ), "YHALF_TO_CELL[y_half] should equal y_half // 2"
+        assert YHALF_TO_CELL[CORE_Y_HALF] == HEIGHT - 1, "Core row should be 8"
+
+    def test_yhalf_to_cell_is_read_only(self):
+        """Verify the shared lookup table cannot be mutated."""
+        assert not YHALF_TO_CELL.flags.writeable, "YHALF_TO_CELL should be read-only"
+
+    def test_yhalf_to_row_offset_lookup(self):
+        """Verify y_half -> flat row offset table matches (y_half // 2) * WIDTH."""
+        y_half = np.arange(HEIGHT * 2)
+        assert np.array_equal(
+            YHALF_TO_ROW_OFFSET, (y_half // 2) * WIDTH
+        ), "YHALF_TO_ROW_OFFSET[y_half] should equal (y_half // 2) * WIDTH"
+        assert YHALF_TO_ROW_OFFSET.dtype == np.intp, "Offsets should be intp"
+        assert not YHALF_TO_ROW_OFFSET.flags.writeable, "Table should be read-only"
+
 
 # =============================================================================
 # Movement Constants Tests (Section 4)
@@ -289,9 +313,28 @@ class TestDtypeSpecifications:
         assert WALL_STATE_DTYPE == np.dtype(np.bool_), "WALL_STATE_DTYPE should be bool_"
 
     def test_cooldown_dtype(self):
-        """Verify cooldown dtype is valid numpy uint16."""
+        """Verify cooldown dtype is valid numpy uint8."""
         assert isinstance(COOLDOWN_DTYPE, np.dtype), "COOLDOWN_DTYPE should be a numpy dtype"
-        assert COOLDOWN_DTYPE == np.dtype(np.uint16), "COOLDOWN_DTYPE should be uint16"
+        assert COOLDOWN_DTYPE == np.dtype(np.uint8), "COOLDOWN_DTYPE should be uint8"
+
+    def test_cooldown_frames_fit_cooldown_dtype(self):
+        """Verify configured cooldowns fit in COOLDOWN_DTYPE without scaling."""
+        max_value = np.iinfo(COOLDOWN_DTYPE).max
+        assert CELL_CD_FRAMES <= max_value, "CELL_CD_FRAMES must fit in COOLDOWN_DTYPE"
+        assert GCD_FRAMES <= max_value, "GCD_FRAMES must fit in COOLDOWN_DTYPE"
+
+    def test_enemy_pos_dtype_holds_full_episode_travel(self):
+        """Verify y_half cannot wrap within one episode of movement."""
+        max_travel = HEIGHT * 2 + MAX_EPISODE_TICKS * ENEMY_SPEED_HALF
+        assert (
+            np.iinfo(ENEMY_POS_DTYPE).max >= max_travel
+        ), "ENEMY_POS_DTYPE must hold the furthest reachable y_half"
+
+    def test_flag_dtypes_match(self):
+        """Verify wall and enemy flag planes share one dtype (no promotion)."""
+        assert (
+            WALL_STATE_DTYPE == ENEMY_ALIVE_DTYPE
+        ), "WALL_STATE_DTYPE and ENEMY_ALIVE_DTYPE should match"
 
     def test_enemy_pos_dtype(self):
         """Verify enemy position dtype is valid numpy int16."""
@@ -382,8 +425,8 @@ class TestValidationConstants:
         assert MAX_WALL_HP == 255, "Max wall HP should be 255 (uint8 max)"
 
     def test_max_cooldown(self):
-        """Verify maximum cooldown (uint16 max)."""
-        assert MAX_COOLDOWN == 65535, "Max cooldown should be 65535 (uint16 max)"
+        """Verify maximum cooldown (uint8 max)."""
+        assert MAX_COOLDOWN == 255, "Max cooldown should be 255 (uint8 max)"
 
     def test_max_enemy_type(self):
         """Verify maximum enemy type (uint8 max)."""
@@ -40,7 +40,7 @@ from src.core.constants import (
     WALL_HP_DTYPE,
     WALL_STATE_DTYPE,
 )
-from src.core.grid import GridState, create_grid_state
+from src.core.grid import GridState, create_grid_state, reset_grid_state
 
 # =============================================================================
 # GridState Dataclass Tests
@@ -86,6 +86,38 @@ class TestGridStateAttributes:
             state.cell_cd, np.ndarray
         ), "cell_cd should be a numpy ndarray"
 
+    def test_grid_state_uses_slots(self):
+        """Verify GridState is slotted (no per-instance __dict__)."""
+        state = create_grid_state()
+
+        assert not hasattr(
+            state, "__dict__"
+        ), "GridState should use __slots__ and have no instance __dict__"
+        assert set(GridState.__slots__) == {
+            "grid",
+            "wall_hp",
+            "wall_armed",
+            "wall_pending",
+            "cell_cd",
+            "gcd",
+            "wall_armed_flat",
+        }, f"Unexpected GridState slots: {GridState.__slots__}"
+
+    def test_wall_armed_flat_is_view_of_wall_armed(self):
+        """Verify wall_armed_flat is a flat view that tracks wall_armed writes."""
+        state = create_grid_state()
+
+        assert state.wall_armed_flat.shape == (GRID_SHAPE[0] * GRID_SHAPE[1],)
+        assert np.shares_memory(
+            state.wall_armed_flat, state.wall_armed
+        ), "wall_armed_flat should be a view of wall_armed"
+
+        state.wall_armed[4, 6] = True
+        assert state.wall_armed_flat[4 * GRID_SHAPE[1] + 6], "write should be visible"
+
+        reset_grid_state(state)
+        assert not state.wall_armed_flat.any(), "reset should be visible"
+
 
 class TestGridArrayShapes:
     """Test grid array shapes match GRID_SHAPE constant."""
@@ -158,22 +190,59 @@ class TestGridArrayDtypes:
         ), f"wall_pending dtype should be {WALL_STATE_DTYPE}, got {state.wall_pending.dtype}"
 
     def test_cell_cd_dtype(self):
-        """Verify cell_cd array dtype is uint16."""
+        """Verify cell_cd array dtype is uint8."""
         state = create_grid_state()
         assert (
             state.cell_cd.dtype == COOLDOWN_DTYPE
         ), f"cell_cd dtype should be {COOLDOWN_DTYPE}, got {state.cell_cd.dtype}"
 
     def test_gcd_dtype(self):
-        """Verify gcd is scalar uint16."""
+        """Verify gcd is scalar uint8."""
         state = create_grid_state()
-        # np.uint16 is a dtype, not a class, so check dtype attribute
+        # np.uint8 is a dtype, not a class, so check dtype attribute
         assert isinstance(
             state.gcd, (np.integer, int)
         ), f"gcd should be a numpy integer, got {type(state.gcd)}"
         assert (
-            state.gcd.dtype == np.uint16
-        ), f"gcd dtype should be uint16, got {state.gcd.dtype}"
+            state.gcd.dtype == COOLDOWN_DTYPE
+        ), f"gcd dtype should be {COOLDOWN_DTYPE}, got {state.gcd.dtype}"
+
+
+class TestGridArrayContiguity:
+    """Test that all grid arrays use C-contiguous row-major layout."""
+
+    @staticmethod
+    def _assert_row_major(arr: np.ndarray, name: str) -> None:
+        expected_strides = (GRID_SHAPE[1] * arr.itemsize, arr.itemsize)
+        assert arr.flags["C_CONTIGUOUS"], f"{name} should be C-contiguous"
+        assert (
+            arr.strides == expected_strides
+        ), f"{name} strides should be {expected_strides}, got {arr.strides}"
+
+    def test_grid_is_row_major(self):
+        """Verify grid array is C-contiguous with row-major strides."""
+        state = create_grid_state()
+        self._assert_row_major(state.grid, "grid")
+
+    def test_wall_hp_is_row_major(self):
+        """Verify wall_hp array is C-contiguous with row-major strides."""
+        state = create_grid_state()
+        self._assert_row_major(state.wall_hp, "wall_hp")
+
+    def test_wall_armed_is_row_major(self):
+        """Verify wall_armed array is C-contiguous with row-major strides."""
+        state = create_grid_state()
+        self._assert_row_major(state.wall_armed, "wall_armed")
+
+    def test_wall_pending_is_row_major(self):
+        """Verify wall_pending array is C-contiguous with row-major strides."""
+        state = create_grid_state()
+        self._assert_row_major(state.wall_pending, "wall_pending")
+
+    def test_cell_cd_is_row_major(self):
+        """Verify cell_cd array is C-contiguous with row-major strides."""
+        state = create_grid_state()
+        self._assert_row_major(state.cell_cd, "cell_cd")
 
 
 class TestGridArrayIndexing:
@@ -322,7 +391,7 @@ class TestFactoryIndependence:
         state1 = create_grid_state()
         state2 = create_grid_state()
 
-        state1.gcd = np.uint16(5)
+        state1.gcd = np.uint8(5)
 
         assert (
             state2.gcd == 0
@@ -370,3 +439,83 @@ class TestFactoryDeterminism:
             state1.cell_cd, state2.cell_cd
         ), "cell_cd arrays should be identical"
         assert state1.gcd == state2.gcd, "gcd values should be identical"
+
+
+# =============================================================================
+# Reset Function Tests
+# =============================================================================
+
+
+class TestResetGridState:
+    """Test reset_grid_state() restores initial state in place."""
+
+    def test_reset_zeros_all_arrays(self):
+        """Verify reset returns every array and gcd to the initial state."""
+        state = create_grid_state()
+        state.grid[4, 6] = 1
+        state.wall_hp[4, 6] = 3
+        state.wall_armed[4, 6] = True
+        state.wall_pending[3, 5] = True
+        state.cell_cd[4, 6] = 50
+        state.gcd = np.uint8(7)
+
+        reset_grid_state(state)
+
+        assert not state.grid.any(), "grid should be all zeros"
+        assert not state.wall_hp.any(), "wall_hp should be all zeros"
+        assert not state.wall_armed.any(), "wall_armed should be all False"
+        assert not state.wall_pending.any(), "wall_pending should be all False"
+        assert not state.cell_cd.any(), "cell_cd should be all zeros"
+        assert state.gcd == 0, "gcd should be 0"
+
+    def test_reset_reuses_arrays(self):
+        """Verify reset mutates the existing arrays instead of reallocating."""
+        state = create_grid_state()
+        arrays_before = (
+            state.grid,
+            state.wall_hp,
+            state.wall_armed,
+            state.wall_pending,
+            state.cell_cd,
+        )
+
+        reset_grid_state(state)
+
+        arrays_after = (
+            state.grid,
+            state.wall_hp,
+            state.wall_armed,
+            state.wall_pending,
+            state.cell_cd,
+        )
+        for before, after in zip(arrays_before, arrays_after):
+            assert after is before, "reset should not rebind arrays"
+
+    def test_reset_preserves_shapes_and_dtypes(self):
+        """Verify reset leaves shapes and dtypes untouched."""
+        state = create_grid_state()
+        reset_grid_state(state)
+
+        assert state.grid.shape == GRID_SHAPE, "grid shape should be unchanged"
+        assert state.grid.dtype == GRID_DTYPE, "grid dtype should be unchanged"
+        assert state.wall_hp.dtype == WALL_HP_DTYPE, "wall_hp dtype should be unchanged"
+        assert (
+            state.wall_armed.dtype == WALL_STATE_DTYPE
+        ), "wall_armed dtype should be unchanged"
+        assert (
+            state.cell_cd.dtype == COOLDOWN_DTYPE
+        ), "cell_cd dtype should be unchanged"
+        assert state.gcd.dtype == COOLDOWN_DTYPE, "gcd dtype should be unchanged"
+
+    def test_reset_matches_fresh_state(self):
+        """Verify a reset state equals a freshly created state."""
+        state = create_grid_state()
+        state.grid[0, 0] = 1
+        state.cell_cd[8, 12] = 150
+        reset_grid_state(state)
+
+        fresh = create_grid_state()
+        assert np.array_equal(state.grid, fresh.grid), "grid should match fresh"
+        assert np.array_equal(state.cell_cd, fresh.cell_cd), "cell_cd should match fresh"
+        assert state.gcd == fresh.gcd, "gcd should match fresh"
+
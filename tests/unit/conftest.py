@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Script Name  : conftest.py
+Description  : Shared pytest fixtures for the unit test suite
+Repository   : firewall-defense-agentic-gaming
+Author       : VintageDon (https://github.com/vintagedon)
+Created      : 2026-01-08
+Link         : https://github.com/radioastronomyio/firewall-defense-agentic-gaming
+
+Description
+-----------
+Fixtures that hand tests zero-initialized grid and enemy state without
+paying factory allocation cost per test. One GridState/EnemyState pair is
+built per test module and reset in place (reset_grid_state /
+reset_enemy_state) before every test that requests it, so each test still
+starts from a state indistinguishable from a fresh factory call.
+
+The pool is per module and per process, and every test resets it before
+use, so no test depends on which tests ran before it or in which worker.
+A parallel runner (e.g. pytest-xdist) can distribute tests in any grouping
+without xdist_group markers; the suite registers no such plugin markers.
+
+Cloning a prebuilt reference state (one .copy() per array) was measured
+as an alternative and gains little: ~2.0 µs per GridState vs ~2.3 µs for
+create_grid_state(), against ~1.3 µs for the in-place reset used here.
+Tests that need extra independent instances call the factories directly.
+
+Fixtures
+--------
+- fresh_states: (GridState, EnemyState) tuple, zeroed before each test
+- fresh_grid: GridState alone (the pooled grid), zeroed before each test
+- fresh_enemies: EnemyState alone (the pooled enemies), zeroed before each test
+
+Usage
+-----
+    def test_example(self, fresh_states):
+        grid, enemies = fresh_states
+        grid.wall_armed[4, 6] = True
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+import pytest
+
+from src.core.enemies import EnemyState, create_enemy_state, reset_enemy_state
+from src.core.grid import GridState, create_grid_state, reset_grid_state
+
+# =============================================================================
+# State Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def _state_pool() -> tuple[GridState, EnemyState]:
+    """Build one GridState/EnemyState pair shared across a test module."""
+    return create_grid_state(), create_enemy_state()
+
+
+@pytest.fixture
+def fresh_states(_state_pool) -> tuple[GridState, EnemyState]:
+    """
+    Provide zeroed (GridState, EnemyState) backed by module-shared storage.
+
+    The pooled states are reset in place before each test, so tests must
+    not rely on array identity across tests and must not keep references
+    to the states after they finish. Tests that need two independent
+    instances should call the factories directly.
+    """
+    grid, enemies = _state_pool
+    reset_grid_state(grid)
+    reset_enemy_state(enemies)
+    return grid, enemies
+
+
+@pytest.fixture
+def fresh_grid(fresh_states) -> GridState:
+    """Provide the zeroed pooled GridState for tests that need no enemies."""
+    return fresh_states[0]
+
+
+@pytest.fixture
+def fresh_enemies(fresh_states) -> EnemyState:
+    """Provide the zeroed pooled EnemyState for tests that need no grid."""
+    return fresh_states[1]
@@ -42,12 +42,96 @@ Examples
 # =============================================================================
 
 import numpy as np
-
-from src.core.collision import detect_collisions, detect_core_breach, resolve_collisions
+import pytest
+
+from src.core.collision import (
+    _apply_wall_damage_dense,
+    _apply_wall_damage_sparse,
+    any_collision,
+    detect_collisions,
+    detect_collisions_batch,
+    detect_core_breach,
+    resolve_collisions,
+    step_collisions,
+)
 from src.core.constants import EMPTY, MAX_ENEMIES
-from src.core.enemies import create_enemy_state
+from src.core.enemies import count_alive, create_enemy_state, place_enemies
 from src.core.grid import create_grid_state
 
+# =============================================================================
+# Test Helpers
+# =============================================================================
+
+
+def make_scenario(armed=(), pending=(), enemies=(), dead=()):
+    """
+    Build a read-only collision scenario from fresh factory state.
+
+    Parameters
+    ----------
+    armed, pending : iterable of (y, x)
+        Cells holding armed / pending walls (grid is set to 1 for both).
+    enemies : iterable of (y_half, x)
+        Enemy positions, placed alive into slots 0..n-1 in order.
+    dead : iterable of int
+        Slot indices to mark dead after placement (positions are kept).
+
+    Returns
+    -------
+    tuple[GridState, EnemyState]
+        States whose input arrays are marked read-only, so any write by the
+        code under test raises instead of silently mutating the scenario.
+        collision_out stays writable because detect_collisions fills it.
+    """
+    grid = create_grid_state()
+    enemy_state = create_enemy_state()
+
+    for y, x in armed:
+        grid.grid[y, x] = 1
+        grid.wall_armed[y, x] = True
+    for y, x in pending:
+        grid.grid[y, x] = 1
+        grid.wall_pending[y, x] = True
+
+    if enemies:
+        y_half, x = np.array(enemies).T
+        place_enemies(enemy_state, y_half, x)
+    enemy_state.enemy_alive[list(dead)] = False
+
+    for arr in (
+        grid.grid,
+        grid.wall_hp,
+        grid.wall_armed,
+        grid.wall_pending,
+        enemy_state.enemy_y_half,
+        enemy_state.enemy_x,
+        enemy_state.enemy_alive,
+    ):
+        arr.setflags(write=False)
+
+    return grid, enemy_state
+
+
+def arm_wall(grid, y, x, hp=None):
+    """Place an armed wall at (y, x), optionally with the given HP."""
+    grid.grid[y, x] = 1
+    grid.wall_armed[y, x] = True
+    if hp is not None:
+        grid.wall_hp[y, x] = hp
+
+
+def arm_enemies(enemies, count, *, y_half, x):
+    """
+    Mark slots 0..count-1 alive at the given positions.
+
+    y_half and x may be scalars (all enemies share them) or length-count
+    sequences; each field is written with one slice assignment.
+    """
+    enemies.enemy_alive[:count] = True
+    enemies.enemy_y_half[:count] = y_half
+    enemies.enemy_x[:count] = x
+
+
 # =============================================================================
 # Basic Collision Detection Tests
 # =============================================================================
@@ -56,14 +140,12 @@ from src.core.grid import create_grid_state
 class TestDetectCollisionsBasic:
     """Test basic collision detection scenarios."""
 
-    def test_no_enemies_alive_returns_all_false(self):
+    def test_no_enemies_alive_returns_all_false(self, fresh_states):
         """Verify detect_collisions returns all False when no enemies alive."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place armed wall
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
+        arm_wall(grid, 4, 6)
 
         # No enemies alive
         collisions = detect_collisions(grid, enemies)
@@ -71,58 +153,47 @@ class TestDetectCollisionsBasic:
         assert collisions.shape == (MAX_ENEMIES,), f"Shape should be ({MAX_ENEMIES},)"
         assert not collisions.any(), "All collisions should be False when no enemies alive"
 
-    def test_no_armed_walls_returns_all_false(self):
+    def test_no_armed_walls_returns_all_false(self, fresh_states):
         """Verify detect_collisions returns all False when no armed walls."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Spawn enemy
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 8  # cell 4
-        enemies.enemy_x[0] = 6
+        arm_enemies(enemies, 1, y_half=8, x=6)  # cell 4
 
         # No armed walls (grid is empty)
         collisions = detect_collisions(grid, enemies)
 
         assert not collisions.any(), "All collisions should be False when no armed walls"
 
-    def test_single_enemy_on_armed_wall_returns_true(self):
+    def test_single_enemy_on_armed_wall_returns_true(self, fresh_states):
         """Verify detect_collisions returns True for enemy on armed wall."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place and arm wall
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
+        arm_wall(grid, 4, 6)
 
         # Spawn enemy at wall position
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 8  # cell 4
-        enemies.enemy_x[0] = 6
+        arm_enemies(enemies, 1, y_half=8, x=6)  # cell 4
 
         collisions = detect_collisions(grid, enemies)
 
-        assert collisions[0] == True, "Enemy on armed wall should collide"
+        assert collisions[0], "Enemy on armed wall should collide"
         assert not collisions[1:].any(), "Other slots should be False"
 
-    def test_single_enemy_on_empty_cell_returns_false(self):
+    def test_single_enemy_on_empty_cell_returns_false(self, fresh_states):
         """Verify detect_collisions returns False for enemy on empty cell."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Spawn enemy at empty cell
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 8  # cell 4
-        enemies.enemy_x[0] = 6
+        arm_enemies(enemies, 1, y_half=8, x=6)  # cell 4
 
         collisions = detect_collisions(grid, enemies)
 
-        assert collisions[0] == False, "Enemy on empty cell should not collide"
+        assert not collisions[0], "Enemy on empty cell should not collide"
 
-    def test_single_enemy_on_pending_wall_returns_false(self):
+    def test_single_enemy_on_pending_wall_returns_false(self, fresh_states):
         """Verify detect_collisions returns False for enemy on pending (unarmed) wall."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place pending wall (not armed)
         grid.grid[4, 6] = 1
@@ -130,13 +201,11 @@ class TestDetectCollisionsBasic:
         grid.wall_armed[4, 6] = False
 
         # Spawn enemy at pending wall position
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 8  # cell 4
-        enemies.enemy_x[0] = 6
+        arm_enemies(enemies, 1, y_half=8, x=6)  # cell 4
 
         collisions = detect_collisions(grid, enemies)
 
-        assert collisions[0] == False, "Enemy on pending wall should not collide"
+        assert not collisions[0], "Enemy on pending wall should not collide"
 
 
 # =============================================================================
@@ -145,131 +214,76 @@ class TestDetectCollisionsBasic:
 
 
 class TestDetectCollisionsMultiple:
-    """Test multiple enemy collision scenarios."""
+    """Test multiple enemy collision scenarios (read-only inputs)."""
 
     def test_multiple_enemies_some_on_armed_walls(self):
         """Verify detect_collisions correctly identifies multiple collisions."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
-
-        # Place armed walls at (4, 6) and (5, 7)
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
-        grid.grid[5, 7] = 1
-        grid.wall_armed[5, 7] = True
-
-        # Spawn 3 enemies
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 8  # cell 4
-        enemies.enemy_x[0] = 6  # On armed wall
-
-        enemies.enemy_alive[1] = True
-        enemies.enemy_y_half[1] = 10  # cell 5
-        enemies.enemy_x[1] = 7  # On armed wall
-
-        enemies.enemy_alive[2] = True
-        enemies.enemy_y_half[2] = 4  # cell 2
-        enemies.enemy_x[2] = 3  # On empty cell
+        # Armed walls at (4, 6) and (5, 7); enemy 2 on empty cell (2, 3)
+        grid, enemies = make_scenario(
+            armed=[(4, 6), (5, 7)],
+            enemies=[(8, 6), (10, 7), (4, 3)],
+        )
 
         collisions = detect_collisions(grid, enemies)
 
-        assert collisions[0] == True, "Enemy 0 on armed wall should collide"
-        assert collisions[1] == True, "Enemy 1 on armed wall should collide"
-        assert collisions[2] == False, "Enemy 2 on empty cell should not collide"
+        assert collisions[0], "Enemy 0 on armed wall should collide"
+        assert collisions[1], "Enemy 1 on armed wall should collide"
+        assert not collisions[2], "Enemy 2 on empty cell should not collide"
 
     def test_multiple_enemies_on_same_armed_wall_cell(self):
         """Verify detect_collisions returns True for all enemies on same armed wall."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
-
-        # Place armed wall
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
-
-        # Spawn 3 enemies at same cell
-        for i in range(3):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = 8  # cell 4
-            enemies.enemy_x[i] = 6  # Same column
+        # Three enemies at the same armed cell (4, 6)
+        grid, enemies = make_scenario(armed=[(4, 6)], enemies=[(8, 6)] * 3)
 
         collisions = detect_collisions(grid, enemies)
 
         # All three should collide
-        assert collisions[0] == True, "Enemy 0 should collide"
-        assert collisions[1] == True, "Enemy 1 should collide"
-        assert collisions[2] == True, "Enemy 2 should collide"
+        assert collisions[0], "Enemy 0 should collide"
+        assert collisions[1], "Enemy 1 should collide"
+        assert collisions[2], "Enemy 2 should collide"
 
     def test_mix_of_alive_and_dead_enemies(self):
         """Verify detect_collisions only marks alive enemies as colliding."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
-
-        # Place armed wall
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
-
-        # Mix of alive and dead enemies at wall position
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 8
-        enemies.enemy_x[0] = 6
-
-        enemies.enemy_alive[1] = False  # Dead
-        enemies.enemy_y_half[1] = 8
-        enemies.enemy_x[1] = 6
-
-        enemies.enemy_alive[2] = True
-        enemies.enemy_y_half[2] = 8
-        enemies.enemy_x[2] = 6
-
-        enemies.enemy_alive[3] = False  # Dead
-        enemies.enemy_y_half[3] = 8
-        enemies.enemy_x[3] = 6
+        # Four enemies at the armed wall position, slots 1 and 3 dead
+        grid, enemies = make_scenario(
+            armed=[(4, 6)], enemies=[(8, 6)] * 4, dead=[1, 3]
+        )
 
         collisions = detect_collisions(grid, enemies)
 
-        assert collisions[0] == True, "Alive enemy 0 should collide"
-        assert collisions[1] == False, "Dead enemy 1 should not collide"
-        assert collisions[2] == True, "Alive enemy 2 should collide"
-        assert collisions[3] == False, "Dead enemy 3 should not collide"
+        assert collisions[0], "Alive enemy 0 should collide"
+        assert not collisions[1], "Dead enemy 1 should not collide"
+        assert collisions[2], "Alive enemy 2 should collide"
+        assert not collisions[3], "Dead enemy 3 should not collide"
 
     def test_multiple_armed_walls_multiple_enemies(self):
         """Verify detect_collisions handles multiple armed walls and enemies."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
-
-        # Place 3 armed walls
-        for i, (y, x) in enumerate([(2, 3), (4, 6), (6, 9)]):
-            grid.grid[y, x] = 1
-            grid.wall_armed[y, x] = True
-
-        # Spawn 5 enemies at various positions
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 4  # cell 2
-        enemies.enemy_x[0] = 3  # On armed wall
-
-        enemies.enemy_alive[1] = True
-        enemies.enemy_y_half[1] = 8  # cell 4
-        enemies.enemy_x[1] = 6  # On armed wall
+        # Three armed walls; enemies 0-2 on them, enemies 3-4 on empty cells
+        grid, enemies = make_scenario(
+            armed=[(2, 3), (4, 6), (6, 9)],
+            enemies=[(4, 3), (8, 6), (12, 9), (6, 5), (10, 8)],
+        )
 
-        enemies.enemy_alive[2] = True
-        enemies.enemy_y_half[2] = 12  # cell 6
-        enemies.enemy_x[2] = 9  # On armed wall
+        collisions = detect_collisions(grid, enemies)
 
-        enemies.enemy_alive[3] = True
-        enemies.enemy_y_half[3] = 6  # cell 3
-        enemies.enemy_x[3] = 5  # Empty cell
+        assert collisions[0], "Enemy 0 on armed wall should collide"
+        assert collisions[1], "Enemy 1 on armed wall should collide"
+        assert collisions[2], "Enemy 2 on armed wall should collide"
+        assert not collisions[3], "Enemy 3 on empty cell should not collide"
+        assert not collisions[4], "Enemy 4 on empty cell should not collide"
 
-        enemies.enemy_alive[4] = True
-        enemies.enemy_y_half[4] = 10  # cell 5
-        enemies.enemy_x[4] = 8  # Empty cell
+    def test_pending_and_armed_walls_inputs_stay_read_only(self):
+        """Verify detection works on read-only inputs and leaves them unchanged."""
+        grid, enemies = make_scenario(
+            armed=[(4, 6)], pending=[(5, 7)], enemies=[(8, 6), (10, 7)]
+        )
 
         collisions = detect_collisions(grid, enemies)
 
-        assert collisions[0] == True, "Enemy 0 on armed wall should collide"
-        assert collisions[1] == True, "Enemy 1 on armed wall should collide"
-        assert collisions[2] == True, "Enemy 2 on armed wall should collide"
-        assert collisions[3] == False, "Enemy 3 on empty cell should not collide"
-        assert collisions[4] == False, "Enemy 4 on empty cell should not collide"
+        assert collisions[0], "Enemy on armed wall should collide"
+        assert not collisions[1], "Enemy on pending wall should not collide"
+        assert not grid.wall_armed.flags.writeable, "wall_armed should stay read-only"
+        assert not enemies.enemy_alive.flags.writeable, "enemy_alive should stay read-only"
 
 
 # =============================================================================
@@ -280,110 +294,51 @@ class TestDetectCollisionsMultiple:
 class TestDetectCollisionsHalfCell:
     """Test half-cell position edge cases."""
 
-    def test_enemy_at_y_half_zero_on_armed_wall(self):
-        """Verify y_half=0 (cell 0) on armed wall collides."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
-
-        # Place armed wall at top row
-        grid.grid[0, 6] = 1
-        grid.wall_armed[0, 6] = True
-
-        # Spawn enemy at y_half=0 (cell 0)
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 0
-        enemies.enemy_x[0] = 6
-
-        collisions = detect_collisions(grid, enemies)
-
-        assert collisions[0] == True, "y_half=0 on armed wall should collide"
-
-    def test_enemy_at_y_half_one_on_armed_wall(self):
-        """Verify y_half=1 (still cell 0) on armed wall collides."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
-
-        # Place armed wall at top row
-        grid.grid[0, 6] = 1
-        grid.wall_armed[0, 6] = True
-
-        # Spawn enemy at y_half=1 (mid-cell, still cell 0)
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 1
-        enemies.enemy_x[0] = 6
-
-        collisions = detect_collisions(grid, enemies)
-
-        assert collisions[0] == True, "y_half=1 on armed wall should collide"
-
-    def test_enemy_at_y_half_two_on_armed_wall(self):
-        """Verify y_half=2 (cell 1) on armed wall collides."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+    @pytest.mark.parametrize(
+        "y_half,wall_row",
+        [
+            (0, 0),   # top row
+            (1, 0),   # mid-cell, still cell 0
+            (2, 1),   # first half-step of cell 1
+            (17, 8),  # bottom row
+        ],
+    )
+    def test_enemy_at_y_half_on_armed_wall(self, fresh_states, y_half, wall_row):
+        """Verify an enemy at y_half on an armed wall in row y_half // 2 collides."""
+        grid, enemies = fresh_states
 
-        # Place armed wall at row 1
-        grid.grid[1, 6] = 1
-        grid.wall_armed[1, 6] = True
+        grid.grid[wall_row, 6] = 1
+        grid.wall_armed[wall_row, 6] = True
 
-        # Spawn enemy at y_half=2 (cell 1)
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 2
-        enemies.enemy_x[0] = 6
+        arm_enemies(enemies, 1, y_half=y_half, x=6)
 
         collisions = detect_collisions(grid, enemies)
 
-        assert collisions[0] == True, "y_half=2 on armed wall should collide"
-
-    def test_enemy_at_y_half_seventeen_on_armed_wall(self):
-        """Verify y_half=17 (cell 8, bottom row) on armed wall collides."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
-
-        # Place armed wall at bottom row
-        grid.grid[8, 6] = 1
-        grid.wall_armed[8, 6] = True
-
-        # Spawn enemy at y_half=17 (cell 8)
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 17
-        enemies.enemy_x[0] = 6
-
-        collisions = detect_collisions(grid, enemies)
+        assert collisions[0], f"y_half={y_half} on armed wall should collide"
 
-        assert collisions[0] == True, "y_half=17 on armed wall should collide"
-
-    def test_half_cell_boundary_crossing(self):
+    def test_half_cell_boundary_crossing(self, fresh_states):
         """Verify collision detection works across cell boundaries."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place armed wall at row 1
-        grid.grid[1, 6] = 1
-        grid.wall_armed[1, 6] = True
-
-        # Test multiple y_half values that map to cell 1
-        y_half_values = [2, 3]  # Both map to cell 1
+        arm_wall(grid, 1, 6)
 
-        for i, y_half in enumerate(y_half_values):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = y_half
-            enemies.enemy_x[i] = 6
+        # Two enemies at y_half 2 and 3, which both map to cell 1
+        arm_enemies(enemies, 2, y_half=(2, 3), x=6)
 
         collisions = detect_collisions(grid, enemies)
 
         # Both should collide
-        assert collisions[0] == True, "y_half=2 should collide"
-        assert collisions[1] == True, "y_half=3 should collide"
+        assert collisions[0], "y_half=2 should collide"
+        assert collisions[1], "y_half=3 should collide"
 
-    def test_half_cell_conversion_correctness(self):
+    def test_half_cell_conversion_correctness(self, fresh_states):
         """Verify cell lookup uses integer division correctly."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place armed walls at rows 0, 1, 2
-        for y in [0, 1, 2]:
-            grid.grid[y, 6] = 1
-            grid.wall_armed[y, 6] = True
+        grid.grid[0:3, 6] = 1
+        grid.wall_armed[0:3, 6] = True
 
         # Test y_half values and expected cells
         test_cases = [
@@ -395,16 +350,20 @@ class TestDetectCollisionsHalfCell:
             (5, 2),  # y_half=5 -> cell 2
         ]
 
-        for i, (y_half, expected_cell) in enumerate(test_cases):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = y_half
-            enemies.enemy_x[i] = 6
+        # Place all enemies in one batch (one bulk store per field)
+        y_halves = np.array([y_half for y_half, _ in test_cases])
+        columns = np.full(len(test_cases), 6)
+        place_enemies(enemies, y_halves, columns)
 
         collisions = detect_collisions(grid, enemies)
 
-        # All should collide (all on armed walls)
-        for i in range(len(test_cases)):
-            assert collisions[i] == True, f"y_half={test_cases[i][0]} should collide at cell {expected_cell}"
+        # All should collide (all on armed walls); one compare reports every
+        # mismatching slot at once
+        np.testing.assert_array_equal(
+            collisions[: len(test_cases)],
+            True,
+            err_msg="every y_half should collide at its cell (y_half // 2)",
+        )
 
 
 # =============================================================================
@@ -415,116 +374,212 @@ class TestDetectCollisionsHalfCell:
 class TestDetectCollisionsReturnShape:
     """Validate return array properties."""
 
-    def test_return_shape_is_always_max_enemies(self):
+    def test_return_shape_is_always_max_enemies(self, fresh_states):
         """Verify return shape is always (MAX_ENEMIES,) regardless of alive count."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Test with 0 alive enemies
         collisions = detect_collisions(grid, enemies)
         assert collisions.shape == (MAX_ENEMIES,), f"Shape should be ({MAX_ENEMIES},)"
 
         # Test with 1 alive enemy
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 8
-        enemies.enemy_x[0] = 6
+        arm_enemies(enemies, 1, y_half=8, x=6)
         collisions = detect_collisions(grid, enemies)
         assert collisions.shape == (MAX_ENEMIES,), f"Shape should be ({MAX_ENEMIES},)"
 
         # Test with 10 alive enemies (keep positions within grid bounds)
-        for i in range(10):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = i   # Use i instead of i*2 to stay within bounds
-            enemies.enemy_x[i] = i % 13
+        arm_enemies(enemies, 10, y_half=np.arange(10), x=np.arange(10) % 13)
         collisions = detect_collisions(grid, enemies)
         assert collisions.shape == (MAX_ENEMIES,), f"Shape should be ({MAX_ENEMIES},)"
 
-    def test_return_dtype_is_bool(self):
+    def test_return_dtype_is_bool(self, fresh_states):
         """Verify return array dtype is bool."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         collisions = detect_collisions(grid, enemies)
 
         assert collisions.dtype == np.bool_, f"Return dtype should be bool_, got {collisions.dtype}"
 
-    def test_dead_enemy_slots_always_false(self):
+    def test_dead_enemy_slots_always_false(self, fresh_states):
         """Verify dead enemy slots always return False regardless of position."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place armed wall
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
+        arm_wall(grid, 4, 6)
 
         # Set all enemies to wall position, but only mark some as alive
-        for i in range(10):
-            enemies.enemy_y_half[i] = 8
-            enemies.enemy_x[i] = 6
-
-        enemies.enemy_alive[0] = True
-        enemies.enemy_alive[2] = True
-        enemies.enemy_alive[4] = True
-        enemies.enemy_alive[6] = True
-        enemies.enemy_alive[8] = True
+        enemies.enemy_y_half[:10] = 8
+        enemies.enemy_x[:10] = 6
+        enemies.enemy_alive[0:10:2] = True
         # Slots 1, 3, 5, 7, 9 are dead
 
         collisions = detect_collisions(grid, enemies)
 
         # Alive slots should be True
-        assert collisions[0] == True, "Alive slot 0 should collide"
-        assert collisions[2] == True, "Alive slot 2 should collide"
-        assert collisions[4] == True, "Alive slot 4 should collide"
-        assert collisions[6] == True, "Alive slot 6 should collide"
-        assert collisions[8] == True, "Alive slot 8 should collide"
+        assert collisions[0], "Alive slot 0 should collide"
+        assert collisions[2], "Alive slot 2 should collide"
+        assert collisions[4], "Alive slot 4 should collide"
+        assert collisions[6], "Alive slot 6 should collide"
+        assert collisions[8], "Alive slot 8 should collide"
 
         # Dead slots should be False
-        assert collisions[1] == False, "Dead slot 1 should not collide"
-        assert collisions[3] == False, "Dead slot 3 should not collide"
-        assert collisions[5] == False, "Dead slot 5 should not collide"
-        assert collisions[7] == False, "Dead slot 7 should not collide"
-        assert collisions[9] == False, "Dead slot 9 should not collide"
+        assert not collisions[1], "Dead slot 1 should not collide"
+        assert not collisions[3], "Dead slot 3 should not collide"
+        assert not collisions[5], "Dead slot 5 should not collide"
+        assert not collisions[7], "Dead slot 7 should not collide"
+        assert not collisions[9], "Dead slot 9 should not collide"
 
-    def test_all_slots_false_when_no_collisions(self):
+    def test_all_slots_false_when_no_collisions(self, fresh_states):
         """Verify all slots are False when no collisions occur."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Spawn multiple enemies on empty cells
-        for i in range(5):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = i * 2
-            enemies.enemy_x[i] = i
+        arm_enemies(enemies, 5, y_half=np.arange(0, 10, 2), x=np.arange(5))
 
         collisions = detect_collisions(grid, enemies)
 
         assert not collisions.any(), "All slots should be False when no collisions"
 
-    def test_all_slots_true_when_all_on_armed_walls(self):
+    def test_all_slots_true_when_all_on_armed_walls(self, fresh_states):
         """Verify all alive slots are True when all on armed walls."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place armed walls for each enemy
-        for i in range(5):
-            y = i * 2
-            x = i
-            grid.grid[y, x] = 1
-            grid.wall_armed[y, x] = True
+        ys = np.arange(0, 10, 2)
+        xs = np.arange(5)
+        grid.grid[ys, xs] = 1
+        grid.wall_armed[ys, xs] = True
 
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = y * 2  # cell y
-            enemies.enemy_x[i] = x
+        arm_enemies(enemies, 5, y_half=ys * 2, x=xs)  # cell y
 
         collisions = detect_collisions(grid, enemies)
 
-        # First 5 should be True
-        for i in range(5):
-            assert collisions[i] == True, f"Enemy {i} on armed wall should collide"
+        # First 5 should be True, rest False (dead)
+        assert collisions[:5].all(), "Enemies on armed walls should collide"
+        assert not collisions[5:].any(), "Dead slots should not collide"
 
-        # Rest should be False (dead)
-        for i in range(5, MAX_ENEMIES):
-            assert collisions[i] == False, f"Dead slot {i} should not collide"
+    def test_any_collision_matches_any(self, fresh_states):
+        """Verify any_collision agrees with ndarray.any() on collision masks."""
+        grid, enemies = fresh_states
+
+        collisions = detect_collisions(grid, enemies)
+        assert any_collision(collisions) is False, "Empty mask should report no collision"
+
+        arm_wall(grid, 4, 6)
+        enemies.enemy_alive[MAX_ENEMIES - 1] = True
+        enemies.enemy_y_half[MAX_ENEMIES - 1] = 8
+        enemies.enemy_x[MAX_ENEMIES - 1] = 6
+
+        collisions = detect_collisions(grid, enemies)
+        assert any_collision(collisions) is True, "Hit in the last slot should be found"
+
+    def test_any_collision_handles_batched_masks(self):
+        """Verify any_collision on (n_envs, MAX_ENEMIES) masks from the batch API."""
+        batch = np.zeros((2, MAX_ENEMIES), dtype=np.bool_)
+        assert any_collision(batch) is False, "All-False batch should report no collision"
+
+        batch[1, 0] = True
+        assert any_collision(batch) is True, "Hit in the second episode should be found"
+
+    def test_returns_preallocated_collision_buffer(self, fresh_states):
+        """Verify the result is written into enemy_state.collision_out."""
+        grid, enemies = fresh_states
+
+        arm_wall(grid, 4, 6)
+        arm_enemies(enemies, 1, y_half=8, x=6)
+
+        collisions = detect_collisions(grid, enemies)
+
+        assert collisions is enemies.collision_out, "Should reuse collision_out buffer"
+        assert collisions[0], "Enemy on armed wall should collide"
+
+        # Second call overwrites the same buffer in place
+        enemies.enemy_alive[0] = False
+        collisions2 = detect_collisions(grid, enemies)
+        assert collisions2 is collisions, "Buffer should be reused across calls"
+        assert not collisions2.any(), "Stale results should be overwritten"
+
+    def test_explicit_out_buffer(self, fresh_states):
+        """Verify an explicit out buffer receives the result."""
+        grid, enemies = fresh_states
+
+        arm_wall(grid, 4, 6)
+        arm_enemies(enemies, 1, y_half=8, x=6)
+
+        out = np.zeros(MAX_ENEMIES, dtype=np.bool_)
+        collisions = detect_collisions(grid, enemies, out=out)
+
+        assert collisions is out, "Should return the provided out buffer"
+        assert out[0], "Enemy on armed wall should collide"
+        assert not enemies.collision_out.any(), "Default buffer should be untouched"
+
+    def test_no_alive_enemies_clears_stale_out_buffer(self, fresh_states):
+        """Verify the no-alive early exit still clears the out buffer."""
+        grid, enemies = fresh_states
+
+        grid.grid[4, 6] = 1
+        grid.wall_armed[4, 6] = True
+        enemies.enemy_y_half[0] = 8  # dead slot parked on the armed wall
+        enemies.enemy_x[0] = 6
+
+        out = np.ones(MAX_ENEMIES, dtype=np.bool_)  # stale mask
+        collisions = detect_collisions(grid, enemies, out=out)
+
+        assert collisions is out, "Should return the provided out buffer"
+        assert not out.any(), "Stale entries should be cleared"
+
+
+# =============================================================================
+# Batched Detection Tests
+# =============================================================================
+
+
+class TestDetectCollisionsBatch:
+    """Validate detect_collisions_batch() against per-episode detection."""
+
+    def test_batch_matches_per_episode_detection(self):
+        """Verify each batch row equals detect_collisions() for that episode."""
+        rng = np.random.default_rng(0)
+        n_envs = 4
+        grids = [create_grid_state() for _ in range(n_envs)]
+        enemy_states = [create_enemy_state() for _ in range(n_envs)]
+
+        for grid, enemies in zip(grids, enemy_states):
+            grid.wall_armed[:] = rng.random(grid.wall_armed.shape) < 0.3
+            enemies.enemy_y_half[:] = rng.integers(0, 18, MAX_ENEMIES)
+            enemies.enemy_x[:] = rng.integers(0, 13, MAX_ENEMIES)
+            enemies.enemy_alive[:] = rng.random(MAX_ENEMIES) < 0.5
+
+        collisions = detect_collisions_batch(
+            np.stack([g.wall_armed for g in grids]),
+            np.stack([e.enemy_y_half for e in enemy_states]),
+            np.stack([e.enemy_x for e in enemy_states]),
+            np.stack([e.enemy_alive for e in enemy_states]),
+        )
+
+        assert collisions.shape == (n_envs, MAX_ENEMIES), "Shape should be (N, MAX_ENEMIES)"
+        assert collisions.dtype == np.bool_, "dtype should be bool"
+        for i, (grid, enemies) in enumerate(zip(grids, enemy_states)):
+            assert np.array_equal(
+                collisions[i], detect_collisions(grid, enemies)
+            ), f"Episode {i} should match detect_collisions()"
+
+    def test_batch_writes_into_out_buffer(self):
+        """Verify the result is written into a caller-provided buffer."""
+        wall_armed = np.zeros((2, 9, 13), dtype=bool)
+        wall_armed[1, 4, 6] = True
+        y_half = np.full((2, MAX_ENEMIES), 8, dtype=np.int16)
+        x = np.full((2, MAX_ENEMIES), 6, dtype=np.int16)
+        alive = np.zeros((2, MAX_ENEMIES), dtype=bool)
+        alive[:, 0] = True
+        out = np.ones((2, MAX_ENEMIES), dtype=bool)
+
+        result = detect_collisions_batch(wall_armed, y_half, x, alive, out=out)
+
+        assert result is out, "Should return the provided out buffer"
+        assert not out[0].any(), "Episode 0 has no armed walls"
+        assert out[1, 0], "Episode 1 enemy 0 is on an armed wall"
+        assert not out[1, 1:].any(), "Dead slots should be False"
 
 
 # =============================================================================
@@ -535,20 +590,15 @@ class TestDetectCollisionsReturnShape:
 class TestResolveCollisionsSingleHit:
     """Test single enemy collision scenarios."""
 
-    def test_single_enemy_on_wall_kills_enemy_damages_wall(self):
+    def test_single_enemy_on_wall_kills_enemy_damages_wall(self, fresh_states):
         """Verify single enemy colliding with wall: enemy dies, wall takes 1 damage."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place and arm wall with HP=3
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
-        grid.wall_hp[4, 6] = 3
+        arm_wall(grid, 4, 6, hp=3)
 
         # Spawn enemy at wall position
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 8  # cell 4
-        enemies.enemy_x[0] = 6
+        arm_enemies(enemies, 1, y_half=8, x=6)  # cell 4
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -556,18 +606,15 @@ class TestResolveCollisionsSingleHit:
 
         assert enemies_killed == 1, "Should kill 1 enemy"
         assert walls_destroyed == 0, "Should not destroy wall (HP=3, damage=1)"
-        assert enemies.enemy_alive[0] == False, "Enemy should be dead"
+        assert not enemies.enemy_alive[0], "Enemy should be dead"
         assert grid.wall_hp[4, 6] == 2, "Wall HP should decrement from 3 to 2"
 
-    def test_enemy_on_empty_cell_no_collision(self):
+    def test_enemy_on_empty_cell_no_collision(self, fresh_states):
         """Verify enemy on empty cell: no state change."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Spawn enemy at empty cell
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 8  # cell 4
-        enemies.enemy_x[0] = 6
+        arm_enemies(enemies, 1, y_half=8, x=6)  # cell 4
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -575,23 +622,18 @@ class TestResolveCollisionsSingleHit:
 
         assert enemies_killed == 0, "Should kill 0 enemies"
         assert walls_destroyed == 0, "Should destroy 0 walls"
-        assert enemies.enemy_alive[0] == True, "Enemy should still be alive"
+        assert enemies.enemy_alive[0], "Enemy should still be alive"
         assert grid.wall_hp[4, 6] == 0, "Wall HP should remain 0 (no wall)"
 
-    def test_wall_hp_decrements_correctly(self):
+    def test_wall_hp_decrements_correctly(self, fresh_states):
         """Verify wall HP decrements correctly (HP=3 -> HP=2 after 1 hit)."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place and arm wall with HP=3
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
-        grid.wall_hp[4, 6] = 3
+        arm_wall(grid, 4, 6, hp=3)
 
         # Spawn enemy at wall position
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 8  # cell 4
-        enemies.enemy_x[0] = 6
+        arm_enemies(enemies, 1, y_half=8, x=6)  # cell 4
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -608,21 +650,15 @@ class TestResolveCollisionsSingleHit:
 class TestResolveCollisionsMultiHit:
     """Test damage stacking with multiple enemies on same wall."""
 
-    def test_two_enemies_same_cell_wall_takes_two_damage(self):
+    def test_two_enemies_same_cell_wall_takes_two_damage(self, fresh_states):
         """Verify 2 enemies same cell: wall takes 2 damage, both enemies die."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place and arm wall with HP=3
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
-        grid.wall_hp[4, 6] = 3
+        arm_wall(grid, 4, 6, hp=3)
 
         # Spawn 2 enemies at same wall position
-        for i in range(2):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = 8  # cell 4
-            enemies.enemy_x[i] = 6
+        arm_enemies(enemies, 2, y_half=8, x=6)  # cell 4
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -630,25 +666,19 @@ class TestResolveCollisionsMultiHit:
 
         assert enemies_killed == 2, "Should kill 2 enemies"
         assert walls_destroyed == 0, "Should not destroy wall (HP=3, damage=2)"
-        assert enemies.enemy_alive[0] == False, "Enemy 0 should be dead"
-        assert enemies.enemy_alive[1] == False, "Enemy 1 should be dead"
+        assert not enemies.enemy_alive[0], "Enemy 0 should be dead"
+        assert not enemies.enemy_alive[1], "Enemy 1 should be dead"
         assert grid.wall_hp[4, 6] == 1, "Wall HP should decrement from 3 to 1"
 
-    def test_three_enemies_same_cell_wall_takes_three_damage(self):
+    def test_three_enemies_same_cell_wall_takes_three_damage(self, fresh_states):
         """Verify 3 enemies same cell: wall takes 3 damage, all enemies die."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place and arm wall with HP=3
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
-        grid.wall_hp[4, 6] = 3
+        arm_wall(grid, 4, 6, hp=3)
 
         # Spawn 3 enemies at same wall position
-        for i in range(3):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = 8  # cell 4
-            enemies.enemy_x[i] = 6
+        arm_enemies(enemies, 3, y_half=8, x=6)  # cell 4
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -656,30 +686,21 @@ class TestResolveCollisionsMultiHit:
 
         assert enemies_killed == 3, "Should kill 3 enemies"
         assert walls_destroyed == 1, "Should destroy wall (HP=3, damage=3)"
-        assert all(enemies.enemy_alive[0:3] == False), "All 3 enemies should be dead"
+        assert not enemies.enemy_alive[0:3].any(), "All 3 enemies should be dead"
         assert grid.wall_hp[4, 6] == 0, "Wall HP should be 0 (destroyed)"
         assert grid.grid[4, 6] == EMPTY, "Grid cell should be EMPTY"
-        assert grid.wall_armed[4, 6] == False, "Wall armed should be False"
+        assert not grid.wall_armed[4, 6], "Wall armed should be False"
 
-    def test_multiple_enemies_different_walls_independent_damage(self):
+    def test_multiple_enemies_different_walls_independent_damage(self, fresh_states):
         """Verify multiple enemies on different walls: each wall damaged independently."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place and arm 2 walls with HP=2
-        for i, (y, x) in enumerate([(3, 4), (5, 7)]):
-            grid.grid[y, x] = 1
-            grid.wall_armed[y, x] = True
-            grid.wall_hp[y, x] = 2
+        arm_wall(grid, 3, 4, hp=2)
+        arm_wall(grid, 5, 7, hp=2)
 
         # Spawn 2 enemies, each on different wall
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 6  # cell 3
-        enemies.enemy_x[0] = 4
-
-        enemies.enemy_alive[1] = True
-        enemies.enemy_y_half[1] = 10  # cell 5
-        enemies.enemy_x[1] = 7
+        arm_enemies(enemies, 2, y_half=(6, 10), x=(4, 7))  # cells 3, 5
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -699,21 +720,15 @@ class TestResolveCollisionsMultiHit:
 class TestResolveCollisionsWallDestruction:
     """Test wall destruction scenarios."""
 
-    def test_wall_destroyed_when_damage_equals_hp(self):
+    def test_wall_destroyed_when_damage_equals_hp(self, fresh_states):
         """Verify wall destroyed when damage >= HP (HP=2, 2 enemies -> destroyed)."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place and arm wall with HP=2
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
-        grid.wall_hp[4, 6] = 2
+        arm_wall(grid, 4, 6, hp=2)
 
         # Spawn 2 enemies at wall position
-        for i in range(2):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = 8  # cell 4
-            enemies.enemy_x[i] = 6
+        arm_enemies(enemies, 2, y_half=8, x=6)  # cell 4
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -723,24 +738,18 @@ class TestResolveCollisionsWallDestruction:
         assert walls_destroyed == 1, "Should destroy 1 wall"
         assert grid.wall_hp[4, 6] == 0, "Wall HP should be 0"
         assert grid.grid[4, 6] == EMPTY, "Grid cell should be EMPTY"
-        assert grid.wall_armed[4, 6] == False, "Wall armed should be False"
-        assert grid.wall_pending[4, 6] == False, "Wall pending should be False"
+        assert not grid.wall_armed[4, 6], "Wall armed should be False"
+        assert not grid.wall_pending[4, 6], "Wall pending should be False"
 
-    def test_wall_survives_when_damage_less_than_hp(self):
+    def test_wall_survives_when_damage_less_than_hp(self, fresh_states):
         """Verify wall survives when damage < HP (HP=3, 2 enemies -> HP=1)."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place and arm wall with HP=3
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
-        grid.wall_hp[4, 6] = 3
+        arm_wall(grid, 4, 6, hp=3)
 
         # Spawn 2 enemies at wall position
-        for i in range(2):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = 8  # cell 4
-            enemies.enemy_x[i] = 6
+        arm_enemies(enemies, 2, y_half=8, x=6)  # cell 4
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -750,12 +759,11 @@ class TestResolveCollisionsWallDestruction:
         assert walls_destroyed == 0, "Should not destroy wall (HP=3, damage=2)"
         assert grid.wall_hp[4, 6] == 1, "Wall HP should be 1"
         assert grid.grid[4, 6] == 1, "Grid cell should still be WALL"
-        assert grid.wall_armed[4, 6] == True, "Wall armed should still be True"
+        assert grid.wall_armed[4, 6], "Wall armed should still be True"
 
-    def test_destruction_clears_all_wall_state(self):
+    def test_destruction_clears_all_wall_state(self, fresh_states):
         """Verify destruction clears all wall state: grid=EMPTY, wall_hp=0, armed=False, pending=False."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place and arm wall with HP=2
         grid.grid[4, 6] = 1
@@ -764,10 +772,7 @@ class TestResolveCollisionsWallDestruction:
         grid.wall_hp[4, 6] = 2
 
         # Spawn 2 enemies at wall position
-        for i in range(2):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = 8  # cell 4
-            enemies.enemy_x[i] = 6
+        arm_enemies(enemies, 2, y_half=8, x=6)  # cell 4
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -775,34 +780,48 @@ class TestResolveCollisionsWallDestruction:
 
         assert grid.grid[4, 6] == EMPTY, "Grid cell should be EMPTY"
         assert grid.wall_hp[4, 6] == 0, "Wall HP should be 0"
-        assert grid.wall_armed[4, 6] == False, "Wall armed should be False"
-        assert grid.wall_pending[4, 6] == False, "Wall pending should be False"
+        assert not grid.wall_armed[4, 6], "Wall armed should be False"
+        assert not grid.wall_pending[4, 6], "Wall pending should be False"
 
-    def test_uint8_safety_no_underflow_when_damage_exceeds_hp(self):
-        """Verify uint8 safety: no underflow when damage > HP (HP=1, 3 enemies -> HP clamps to 0)."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+    @pytest.mark.parametrize(
+        "n_enemies",
+        [3, MAX_ENEMIES],  # scalar few-hit path and bincount path
+    )
+    def test_uint8_safety_no_underflow_when_damage_exceeds_hp(self, fresh_states, n_enemies):
+        """Verify uint8 safety: no underflow when damage > HP (HP=1, n enemies -> HP clamps to 0)."""
+        grid, enemies = fresh_states
 
         # Place and arm wall with HP=1
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
-        grid.wall_hp[4, 6] = 1
+        arm_wall(grid, 4, 6, hp=1)
 
-        # Spawn 3 enemies at wall position (damage=3, HP=1)
-        for i in range(3):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = 8  # cell 4
-            enemies.enemy_x[i] = 6
+        # Spawn n enemies at wall position (damage=n, HP=1)
+        arm_enemies(enemies, n_enemies, y_half=8, x=6)  # cell 4
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
         enemies_killed, walls_destroyed = resolve_collisions(grid, enemies, collisions)
 
-        assert enemies_killed == 3, "Should kill 3 enemies"
+        assert enemies_killed == n_enemies, f"Should kill {n_enemies} enemies"
         assert walls_destroyed == 1, "Should destroy 1 wall"
         assert grid.wall_hp[4, 6] == 0, "Wall HP should clamp to 0 (no underflow)"
         assert grid.grid[4, 6] == EMPTY, "Grid cell should be EMPTY"
 
+    def test_wall_hp_updated_in_place(self, fresh_states):
+        """Verify resolve_collisions mutates wall_hp without rebinding it."""
+        grid, enemies = fresh_states
+        wall_hp_before = grid.wall_hp
+
+        # Armed wall with HP=3 hit by one enemy
+        arm_wall(grid, 4, 6, hp=3)
+        place_enemies(enemies, np.array([8]), np.array([6]))
+
+        collisions = detect_collisions(grid, enemies)
+        resolve_collisions(grid, enemies, collisions)
+
+        assert grid.wall_hp is wall_hp_before, "wall_hp should keep its identity"
+        assert grid.wall_hp.dtype == np.uint8, "wall_hp should stay uint8"
+        assert grid.wall_hp[4, 6] == 2, "Wall HP should be 3 - 1 = 2"
+
 
 # =============================================================================
 # Collision Resolution Tests - Return Values
@@ -812,20 +831,15 @@ class TestResolveCollisionsWallDestruction:
 class TestResolveCollisionsReturnValues:
     """Test return values from resolve_collisions()."""
 
-    def test_return_tuple_shape(self):
+    def test_return_tuple_shape(self, fresh_states):
         """Verify return tuple shape: (enemies_killed, walls_destroyed)."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place and arm wall
-        grid.grid[4, 6] = 1
-        grid.wall_armed[4, 6] = True
-        grid.wall_hp[4, 6] = 2
+        arm_wall(grid, 4, 6, hp=2)
 
         # Spawn enemy
-        enemies.enemy_alive[0] = True
-        enemies.enemy_y_half[0] = 8
-        enemies.enemy_x[0] = 6
+        arm_enemies(enemies, 1, y_half=8, x=6)
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -836,30 +850,17 @@ class TestResolveCollisionsReturnValues:
         assert isinstance(result[0], int), "First element should be int"
         assert isinstance(result[1], int), "Second element should be int"
 
-    def test_return_values_match_actual_mutations(self):
+    def test_return_values_match_actual_mutations(self, fresh_states):
         """Verify return values match actual state mutations."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place and arm 2 walls with different HP
-        grid.grid[3, 4] = 1
-        grid.wall_armed[3, 4] = True
-        grid.wall_hp[3, 4] = 3  # Survives 2 hits
+        arm_wall(grid, 3, 4, hp=3)  # Survives 2 hits
 
-        grid.grid[5, 7] = 1
-        grid.wall_armed[5, 7] = True
-        grid.wall_hp[5, 7] = 2  # Destroyed by 2 hits
+        arm_wall(grid, 5, 7, hp=2)  # Destroyed by 2 hits
 
         # Spawn 4 enemies: 2 on each wall
-        for i in range(2):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = 6  # cell 3
-            enemies.enemy_x[i] = 4
-
-        for i in range(2, 4):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = 10  # cell 5
-            enemies.enemy_x[i] = 7
+        arm_enemies(enemies, 4, y_half=(6, 6, 10, 10), x=(4, 4, 7, 7))  # cells 3, 3, 5, 5
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -869,23 +870,19 @@ class TestResolveCollisionsReturnValues:
         assert enemies_killed == 4, "Return value should indicate 4 enemies killed"
 
         # Verify actual mutations match return values
-        actual_enemies_killed = int(np.sum(~enemies.enemy_alive[0:4]))
+        actual_enemies_killed = 4 - count_alive(enemies, stop=4)
         actual_walls_destroyed = int(
             (grid.grid[3, 4] == EMPTY) + (grid.grid[5, 7] == EMPTY)
         )
         assert enemies_killed == actual_enemies_killed, "Return value should match actual enemies killed"
         assert walls_destroyed == actual_walls_destroyed, "Return value should match actual walls destroyed"
 
-    def test_no_collisions_returns_zero_zero(self):
+    def test_no_collisions_returns_zero_zero(self, fresh_states):
         """Verify no collisions returns (0, 0)."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Spawn enemies on empty cells
-        for i in range(3):
-            enemies.enemy_alive[i] = True
-            enemies.enemy_y_half[i] = i * 2
-            enemies.enemy_x[i] = i
+        arm_enemies(enemies, 3, y_half=np.arange(0, 6, 2), x=np.arange(3))
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -895,26 +892,17 @@ class TestResolveCollisionsReturnValues:
         assert walls_destroyed == 0, "Should destroy 0 walls"
         assert (enemies_killed, walls_destroyed) == (0, 0), "Return should be (0, 0)"
 
-    def test_multiple_walls_destroyed_returns_correct_count(self):
+    def test_multiple_walls_destroyed_returns_correct_count(self, fresh_states):
         """Verify multiple walls destroyed returns correct count."""
-        grid = create_grid_state()
-        enemies = create_enemy_state()
+        grid, enemies = fresh_states
 
         # Place and arm 3 walls with HP=2
-        for i, (y, x) in enumerate([(2, 3), (4, 6), (6, 9)]):
-            grid.grid[y, x] = 1
-            grid.wall_armed[y, x] = True
-            grid.wall_hp[y, x] = 2
+        arm_wall(grid, 2, 3, hp=2)
+        arm_wall(grid, 4, 6, hp=2)
+        arm_wall(grid, 6, 9, hp=2)
 
         # Spawn 2 enemies on each wall (6 total)
-        for i, (y, x) in enumerate([(2, 3), (4, 6), (6, 9)]):
-            enemies.enemy_alive[i * 2] = True
-            enemies.enemy_y_half[i * 2] = y * 2
-            enemies.enemy_x[i * 2] = x
-
-            enemies.enemy_alive[i * 2 + 1] = True
-            enemies.enemy_y_half[i * 2 + 1] = y * 2
-            enemies.enemy_x[i * 2 + 1] = x
+        arm_enemies(enemies, 6, y_half=(4, 4, 8, 8, 12, 12), x=(3, 3, 6, 6, 9, 9))
 
         # Detect and resolve collisions
         collisions = detect_collisions(grid, enemies)
@@ -927,6 +915,101 @@ class TestResolveCollisionsReturnValues:
         assert grid.grid[6, 9] == EMPTY, "Wall at (6,9) should be destroyed"
 
 
+# =============================================================================
+# Fused Detection and Resolution Tests
+# =============================================================================
+
+
+class TestStepCollisions:
+    """Validate step_collisions() against detect + resolve."""
+
+    def test_matches_two_phase_api(self):
+        """Verify the fused pass mutates state exactly like detect + resolve."""
+        rng = np.random.default_rng(3)
+        # Two state pairs built once; every plane the kernels read is
+        # overwritten in full each iteration, so no per-iteration allocation
+        states = [(create_grid_state(), create_enemy_state()) for _ in range(2)]
+        (grid_a, enemies_a), (grid_b, enemies_b) = states
+
+        for _ in range(50):
+            wall_armed = rng.random((9, 13)) < 0.4
+            wall_hp = rng.integers(0, 4, (9, 13)).astype(np.uint8)
+            y_half = rng.integers(0, 18, MAX_ENEMIES)
+            x = rng.integers(0, 13, MAX_ENEMIES)
+            alive = rng.random(MAX_ENEMIES) < 0.6
+
+            for grid, enemies in states:
+                grid.wall_armed[:] = wall_armed
+                grid.wall_pending[:] = ~wall_armed & (wall_hp > 2)
+                grid.grid[:] = grid.wall_armed | grid.wall_pending
+                grid.wall_hp[:] = wall_hp
+                enemies.enemy_y_half[:] = y_half
+                enemies.enemy_x[:] = x
+                enemies.enemy_alive[:] = alive
+
+            expected = resolve_collisions(
+                grid_a, enemies_a, detect_collisions(grid_a, enemies_a)
+            )
+            result = step_collisions(grid_b, enemies_b)
+
+            assert result == expected, "Return values should match detect + resolve"
+            for name in ("grid", "wall_hp", "wall_armed", "wall_pending"):
+                assert np.array_equal(
+                    getattr(grid_a, name), getattr(grid_b, name)
+                ), f"{name} should match detect + resolve"
+            assert np.array_equal(
+                enemies_a.enemy_alive, enemies_b.enemy_alive
+            ), "enemy_alive should match detect + resolve"
+            assert np.array_equal(
+                enemies_a.collision_out, enemies_b.collision_out
+            ), "collision_out should hold the resolved collision mask"
+
+    def test_sparse_and_dense_damage_paths_agree(self):
+        """Verify the scalar few-hit path matches the vectorized damage path."""
+        rng = np.random.default_rng(7)
+        grids = [create_grid_state() for _ in range(2)]
+
+        for _ in range(100):
+            wall_armed = rng.random((9, 13)) < 0.5
+            wall_hp = rng.integers(0, 4, (9, 13)).astype(np.uint8)
+            # Few distinct cells so duplicate hits stack on the same wall
+            colliding_index = rng.integers(0, 6, rng.integers(1, 7)) * 7
+
+            for grid in grids:
+                grid.wall_armed[:] = wall_armed
+                grid.wall_pending[:] = ~wall_armed & (wall_hp > 2)
+                grid.grid[:] = grid.wall_armed | grid.wall_pending
+                grid.wall_hp[:] = wall_hp
+
+            expected = _apply_wall_damage_dense(grids[0], colliding_index)
+            result = _apply_wall_damage_sparse(grids[1], colliding_index)
+
+            assert result == expected, "Walls destroyed should match"
+            for name in ("grid", "wall_hp", "wall_armed", "wall_pending"):
+                assert np.array_equal(
+                    getattr(grids[0], name), getattr(grids[1], name)
+                ), f"{name} should match the vectorized path"
+
+    def test_no_collisions_returns_zero_zero(self, fresh_states):
+        """Verify a tick without collisions leaves state untouched."""
+        grid, enemies = fresh_states
+        place_enemies(enemies, np.array([8, 4]), np.array([6, 3]))
+
+        assert step_collisions(grid, enemies) == (0, 0), "Should return (0, 0)"
+        assert enemies.enemy_alive[:2].all(), "Enemies should stay alive"
+
+    def test_no_alive_enemies_clears_stale_mask(self, fresh_states):
+        """Verify the no-alive early exit still clears collision_out."""
+        grid, enemies = fresh_states
+        grid.wall_armed[4, 6] = True
+        enemies.enemy_y_half[0] = 8  # dead slot parked on the armed wall
+        enemies.enemy_x[0] = 6
+        enemies.collision_out[:] = True  # stale mask from a previous tick
+
+        assert step_collisions(grid, enemies) == (0, 0), "Should return (0, 0)"
+        assert not enemies.collision_out.any(), "collision_out should be cleared"
+
+
 # =============================================================================
 # Core Breach Detection Tests
 # =============================================================================
@@ -935,53 +1018,53 @@ class TestResolveCollisionsReturnValues:
 class TestDetectCoreBreach:
     """Test core breach detection scenarios."""
 
-    def test_y_half_fifteen_no_breach(self):
+    def test_y_half_fifteen_no_breach(self, fresh_states):
         """Verify y_half=15 (row 7): no breach."""
-        enemies = create_enemy_state()
+        _, enemies = fresh_states
 
         enemies.enemy_alive[0] = True
         enemies.enemy_y_half[0] = 15  # Row 7, one above core
 
         breach = detect_core_breach(enemies)
 
-        assert breach == False, "y_half=15 should not breach"
+        assert not breach, "y_half=15 should not breach"
 
-    def test_y_half_sixteen_breach_detected(self):
+    def test_y_half_sixteen_breach_detected(self, fresh_states):
         """Verify y_half=16 (row 8, threshold): breach detected."""
-        enemies = create_enemy_state()
+        _, enemies = fresh_states
 
         enemies.enemy_alive[0] = True
         enemies.enemy_y_half[0] = 16  # Row 8, core row
 
         breach = detect_core_breach(enemies)
 
-        assert breach == True, "y_half=16 should breach"
+        assert breach, "y_half=16 should breach"
 
-    def test_y_half_seventeen_beyond_threshold(self):
+    def test_y_half_seventeen_beyond_threshold(self, fresh_states):
         """Verify y_half=17 (beyond threshold): breach detected."""
-        enemies = create_enemy_state()
+        _, enemies = fresh_states
 
         enemies.enemy_alive[0] = True
         enemies.enemy_y_half[0] = 17  # Beyond core
 
         breach = detect_core_breach(enemies)
 
-        assert breach == True, "y_half=17 should breach"
+        assert breach, "y_half=17 should breach"
 
-    def test_dead_enemy_at_threshold_no_breach(self):
+    def test_dead_enemy_at_threshold_no_breach(self, fresh_states):
         """Verify dead enemy at threshold: no breach (dead enemies ignored)."""
-        enemies = create_enemy_state()
+        _, enemies = fresh_states
 
         enemies.enemy_alive[0] = False  # Dead
         enemies.enemy_y_half[0] = 16  # At threshold
 
         breach = detect_core_breach(enemies)
 
-        assert breach == False, "Dead enemy should not trigger breach"
+        assert not breach, "Dead enemy should not trigger breach"
 
-    def test_multiple_enemies_only_one_breached(self):
+    def test_multiple_enemies_only_one_breached(self, fresh_states):
         """Verify multiple enemies, only one breached: breach detected."""
-        enemies = create_enemy_state()
+        _, enemies = fresh_states
 
         enemies.enemy_alive[0] = True
         enemies.enemy_y_half[0] = 10  # Safe
@@ -994,24 +1077,36 @@ class TestDetectCoreBreach:
 
         breach = detect_core_breach(enemies)
 
-        assert breach == True, "One breached enemy should trigger breach"
+        assert breach, "One breached enemy should trigger breach"
 
-    def test_no_alive_enemies_no_breach(self):
+    def test_no_alive_enemies_no_breach(self, fresh_states):
         """Verify no alive enemies: no breach."""
-        enemies = create_enemy_state()
+        _, enemies = fresh_states
 
         # All enemies dead
-        for i in range(5):
-            enemies.enemy_alive[i] = False
-            enemies.enemy_y_half[i] = 16  # Even at threshold
+        enemies.enemy_alive[:5] = False
+        enemies.enemy_y_half[:5] = 16  # Even at threshold
 
         breach = detect_core_breach(enemies)
 
-        assert breach == False, "No alive enemies should not breach"
+        assert not breach, "No alive enemies should not breach"
+
+    def test_dead_slot_at_core_with_alive_enemy_above(self, fresh_states):
+        """Verify a dead slot at the core row does not count for an alive enemy."""
+        _, enemies = fresh_states
+
+        enemies.enemy_y_half[0] = 16  # Dead, at threshold
+        enemies.enemy_alive[1] = True
+        enemies.enemy_y_half[1] = 10  # Alive, safe
+
+        breach = detect_core_breach(enemies)
+
+        assert isinstance(breach, bool), "Return type should be bool"
+        assert not breach, "Only the dead slot is at the core row"
 
-    def test_return_type_is_bool(self):
+    def test_return_type_is_bool(self, fresh_states):
         """Verify return type is bool."""
-        enemies = create_enemy_state()
+        _, enemies = fresh_states
 
         enemies.enemy_alive[0] = True
         enemies.enemy_y_half[0] = 16
@@ -1019,4 +1114,4 @@ class TestDetectCoreBreach:
         breach = detect_core_breach(enemies)
 
         assert isinstance(breach, bool), "Return type should be bool"
-        assert breach == True, "Should return True for breach"
+        assert breach, "Should return True for breach"
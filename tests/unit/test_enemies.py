@@ -43,6 +43,7 @@ Examples
 # =============================================================================
 
 import numpy as np
+import pytest
 
 from src.core.constants import (
     ENEMY_ALIVE_DTYPE,
@@ -57,8 +58,12 @@ from src.core.constants import (
 from src.core.enemies import (
     EnemyState,
     compact_enemies,
+    count_alive,
     create_enemy_state,
     move_enemies,
+    place_enemies,
+    reset_enemy_state,
+    spawn_enemies,
     spawn_enemy,
 )
 
@@ -183,12 +188,148 @@ class TestEnemyStateFactory:
         state1.enemy_spawn_tick[0] = 100
 
         # state2 should be unchanged
-        assert state2.enemy_alive[0] == False, "state2 should be independent"
+        assert not state2.enemy_alive[0], "state2 should be independent"
         assert state2.enemy_y_half[0] == 0, "state2 should be independent"
         assert state2.enemy_x[0] == 0, "state2 should be independent"
         assert state2.enemy_type[0] == 0, "state2 should be independent"
         assert state2.enemy_spawn_tick[0] == 0, "state2 should be independent"
 
+    def test_arrays_share_one_contiguous_block(self):
+        """Verify all enemy arrays are contiguous views of one allocation."""
+        state = create_enemy_state()
+        arrays = (
+            state.enemy_y_half,
+            state.enemy_x,
+            state.enemy_alive,
+            state.enemy_type,
+            state.enemy_spawn_tick,
+            state.collision_out,
+        )
+
+        block = state.enemy_y_half.base
+        assert block is not None, "enemy arrays should be views of a block"
+        for arr in arrays:
+            assert arr.base is block, "all enemy arrays should share one block"
+            assert arr.flags["C_CONTIGUOUS"], "each enemy array should be contiguous"
+
+        # Views must not overlap each other
+        for i, a in enumerate(arrays):
+            for b in arrays[i + 1 :]:
+                assert not np.shares_memory(a, b), "enemy arrays should not overlap"
+
+    def test_collision_fields_lead_the_block(self):
+        """Verify collision-hot arrays are packed at the start of the block."""
+        state = create_enemy_state()
+        block_start = state.enemy_y_half.base.ctypes.data
+        hot = (
+            state.enemy_y_half,
+            state.enemy_x,
+            state.enemy_alive,
+            state.collision_out,
+        )
+
+        hot_end = max(arr.ctypes.data + arr.nbytes for arr in hot) - block_start
+        assert hot_end == sum(arr.nbytes for arr in hot), (
+            "positions, alive mask and collision_out should be adjacent at the block start"
+        )
+
+    def test_arrays_are_dtype_aligned(self):
+        """Verify every enemy view starts on a boundary aligned to its itemsize."""
+        state = create_enemy_state()
+        for arr in (state.enemy_y_half, state.enemy_x, state.enemy_spawn_tick):
+            assert arr.flags["ALIGNED"], f"{arr.dtype} view should be aligned"
+            assert arr.ctypes.data % arr.itemsize == 0, "view should be itemsize-aligned"
+
+    def test_collision_out_has_correct_shape_and_dtype(self):
+        """Verify collision_out buffer has shape (MAX_ENEMIES,) and dtype bool_."""
+        state = create_enemy_state()
+        assert (
+            state.collision_out.shape == (MAX_ENEMIES,)
+        ), f"collision_out shape should be ({MAX_ENEMIES},)"
+        assert (
+            state.collision_out.dtype == np.bool_
+        ), f"collision_out dtype should be bool_, got {state.collision_out.dtype}"
+        assert not state.collision_out.any(), "collision_out should be all False"
+
+    def test_independent_collision_out_buffers(self):
+        """Verify each call returns an independent collision_out buffer."""
+        state1 = create_enemy_state()
+        state2 = create_enemy_state()
+
+        state1.collision_out[0] = True
+
+        assert not state2.collision_out[0], "state2 should be independent"
+        assert not np.shares_memory(
+            state1.collision_out, state2.collision_out
+        ), "collision_out buffers should not share memory"
+
+
+# =============================================================================
+# Reset Tests
+# =============================================================================
+
+
+class TestResetEnemyState:
+    """Test reset_enemy_state() restores initial state in place."""
+
+    def test_reset_zeros_all_arrays(self):
+        """Verify reset returns every slot array to the initial state."""
+        state = create_enemy_state()
+        rng = np.random.default_rng(42)
+        for tick in range(3):
+            spawn_enemy(state, tick, rng)
+        move_enemies(state)
+        state.collision_out[0] = True
+
+        reset_enemy_state(state)
+
+        assert not state.enemy_y_half.any(), "enemy_y_half should be all zeros"
+        assert not state.enemy_x.any(), "enemy_x should be all zeros"
+        assert not state.enemy_alive.any(), "enemy_alive should be all False"
+        assert not state.enemy_type.any(), "enemy_type should be all zeros"
+        assert not state.enemy_spawn_tick.any(), "enemy_spawn_tick should be all zeros"
+        assert not state.collision_out.any(), "collision_out should be all False"
+
+    def test_reset_reuses_arrays(self):
+        """Verify reset mutates the existing arrays instead of reallocating."""
+        state = create_enemy_state()
+        arrays_before = (
+            state.enemy_y_half,
+            state.enemy_x,
+            state.enemy_alive,
+            state.enemy_type,
+            state.enemy_spawn_tick,
+            state.collision_out,
+        )
+
+        reset_enemy_state(state)
+
+        arrays_after = (
+            state.enemy_y_half,
+            state.enemy_x,
+            state.enemy_alive,
+            state.enemy_type,
+            state.enemy_spawn_tick,
+            state.collision_out,
+        )
+        assert all(
+            before is after for before, after in zip(arrays_before, arrays_after)
+        ), "reset should not rebind any array"
+
+    def test_reset_matches_fresh_state(self):
+        """Verify a reset state equals a freshly created one."""
+        state = create_enemy_state()
+        spawn_enemy(state, 5, np.random.default_rng(0))
+
+        reset_enemy_state(state)
+        fresh = create_enemy_state()
+
+        assert np.array_equal(state.enemy_y_half, fresh.enemy_y_half)
+        assert np.array_equal(state.enemy_x, fresh.enemy_x)
+        assert np.array_equal(state.enemy_alive, fresh.enemy_alive)
+        assert np.array_equal(state.enemy_type, fresh.enemy_type)
+        assert np.array_equal(state.enemy_spawn_tick, fresh.enemy_spawn_tick)
+
 
 # =============================================================================
 # Spawn Logic Tests
@@ -237,7 +378,7 @@ class TestSpawnEnemy:
         state = create_enemy_state()
         rng = np.random.default_rng(42)
         spawn_enemy(state, current_tick=0, rng=rng)
-        assert state.enemy_alive[0] == True, "Spawned slot should be alive"
+        assert state.enemy_alive[0], "Spawned slot should be alive"
 
     def test_spawn_enemy_sets_type_to_drop(self):
         """Verify spawn_enemy sets enemy_type to ENEMY_TYPE_DROP (0)."""
@@ -269,9 +410,9 @@ class TestSpawnEnemy:
         # Next spawn should use slot 1 (first dead)
         success = spawn_enemy(state, current_tick=30, rng=rng)
         assert success is True, "Spawn should find first dead slot"
-        assert state.enemy_alive[1] == True, "Slot 1 should be re-used"
+        assert state.enemy_alive[1], "Slot 1 should be re-used"
         assert state.enemy_spawn_tick[1] == 30, "Spawn tick should be 30"
-        assert state.enemy_alive[3] == False, "Slot 3 should remain dead"
+        assert not state.enemy_alive[3], "Slot 3 should remain dead"
 
     def test_spawn_enemy_deterministic_with_seeded_rng(self):
         """Verify same seed produces same column sequence."""
@@ -313,6 +454,112 @@ class TestSpawnEnemy:
             spawn_enemy(state, current_tick=i, rng=rng)
             assert 0 <= state.enemy_x[i] < WIDTH, f"Column {state.enemy_x[i]} should be in [0, {WIDTH})"
 
+    def test_spawn_after_compaction_keeps_spawn_ticks_sorted(self):
+        """Verify spawn + kill + compact cycles keep alive ticks in order."""
+        state = create_enemy_state()
+        rng = np.random.default_rng(3)
+
+        for tick in range(200):
+            spawn_enemy(state, current_tick=tick, rng=rng)
+            state.enemy_alive[rng.random(MAX_ENEMIES) < 0.1] = False
+            alive_count = compact_enemies(state)
+
+            ticks = state.enemy_spawn_tick[:alive_count]
+            assert (np.diff(ticks) >= 0).all(), f"Ticks unsorted at tick {tick}"
+            assert state.enemy_alive[:alive_count].all(), "Alive slots should be a prefix"
+
+
+class TestSpawnEnemies:
+    """Test spawn_enemies() batch spawning."""
+
+    def test_matches_repeated_spawn_enemy(self):
+        """Verify one batch call equals n spawn_enemy() calls with the same seed."""
+        batch = create_enemy_state()
+        single = create_enemy_state()
+        for state in (batch, single):
+            state.enemy_alive[[1, 4]] = True  # Interleaved live slots
+        rng_batch = np.random.default_rng(42)
+        rng_single = np.random.default_rng(42)
+
+        spawned = spawn_enemies(batch, current_tick=7, rng=rng_batch, n=6)
+        for _ in range(6):
+            spawn_enemy(single, current_tick=7, rng=rng_single)
+
+        assert spawned == 6, "Should report 6 enemies spawned"
+        for name in ("enemy_y_half", "enemy_x", "enemy_alive", "enemy_type", "enemy_spawn_tick"):
+            assert np.array_equal(
+                getattr(batch, name), getattr(single, name)
+            ), f"{name} should match repeated spawn_enemy()"
+        assert (
+            rng_batch.integers(0, 1000) == rng_single.integers(0, 1000)
+        ), "RNG streams should stay in step"
+
+    def test_truncates_when_slots_run_out(self):
+        """Verify only as many enemies as free slots are spawned."""
+        state = create_enemy_state()
+        state.enemy_alive[: MAX_ENEMIES - 2] = True
+        rng = np.random.default_rng(42)
+
+        assert spawn_enemies(state, 0, rng, n=5) == 2, "Only 2 free slots should be filled"
+        assert spawn_enemies(state, 0, rng, n=5) == 0, "Full state should spawn nothing"
+        assert state.enemy_alive.all(), "All slots should now be alive"
+
+    @pytest.mark.parametrize("n", [0, -1, -MAX_ENEMIES])
+    def test_non_positive_n_spawns_nothing(self, fresh_enemies, n):
+        """Verify n <= 0 spawns nothing and leaves the RNG untouched."""
+        rng = np.random.default_rng(42)
+        rng_state = rng.bit_generator.state
+
+        assert spawn_enemies(fresh_enemies, 0, rng, n=n) == 0, "Should spawn nothing"
+        assert not fresh_enemies.enemy_alive.any(), "No slot should become alive"
+        assert rng.bit_generator.state == rng_state, "No column should be drawn"
+
+
+class TestPlaceEnemies:
+    """Test place_enemies() batch placement."""
+
+    def test_places_enemies_in_leading_slots(self):
+        """Verify a batch fills the first free slots with given positions."""
+        state = create_enemy_state()
+        y_half = np.array([0, 3, 8])
+        x = np.array([1, 6, 12])
+
+        placed = place_enemies(state, y_half, x, current_tick=4)
+
+        assert placed == 3, "Should report 3 enemies placed"
+        assert state.enemy_alive[:3].all(), "First 3 slots should be alive"
+        assert not state.enemy_alive[3:].any(), "Remaining slots should stay dead"
+        assert np.array_equal(state.enemy_y_half[:3], y_half), "y_half mismatch"
+        assert np.array_equal(state.enemy_x[:3], x), "x mismatch"
+        assert np.all(state.enemy_type[:3] == ENEMY_TYPE_DROP), "Type should be Drop"
+        assert np.all(state.enemy_spawn_tick[:3] == 4), "Spawn tick should be 4"
+
+    def test_skips_live_slots(self):
+        """Verify placement only writes slots that are currently dead."""
+        state = create_enemy_state()
+        state.enemy_alive[0] = True
+        state.enemy_y_half[0] = 10
+        state.enemy_alive[2] = True
+        state.enemy_y_half[2] = 12
+
+        placed = place_enemies(state, np.array([1, 2]), np.array([5, 7]))
+
+        assert placed == 2, "Should report 2 enemies placed"
+        assert state.enemy_y_half[0] == 10, "Live slot 0 should be untouched"
+        assert state.enemy_y_half[2] == 12, "Live slot 2 should be untouched"
+        assert state.enemy_y_half[1] == 1 and state.enemy_x[1] == 5, "Slot 1 mismatch"
+        assert state.enemy_y_half[3] == 2 and state.enemy_x[3] == 7, "Slot 3 mismatch"
+
+    def test_truncates_when_slots_run_out(self):
+        """Verify only as many enemies as free slots are placed."""
+        state = create_enemy_state()
+        state.enemy_alive[: MAX_ENEMIES - 2] = True
+
+        placed = place_enemies(state, np.zeros(5), np.zeros(5))
+
+        assert placed == 2, "Only 2 free slots should be filled"
+        assert state.enemy_alive.all(), "All slots should now be alive"
+
 
 # =============================================================================
 # Movement Tests
@@ -322,9 +569,9 @@ class TestSpawnEnemy:
 class TestMoveEnemies:
     """Test move_enemies() function for half-cell movement."""
 
-    def test_move_enemies_increments_y_half_by_speed(self):
+    def test_move_enemies_increments_y_half_by_speed(self, fresh_enemies):
         """Verify move_enemies increments y_half by ENEMY_SPEED_HALF."""
-        state = create_enemy_state()
+        state = fresh_enemies
         state.enemy_alive[0] = True
         state.enemy_y_half[0] = 0
 
@@ -332,9 +579,9 @@ class TestMoveEnemies:
 
         assert state.enemy_y_half[0] == ENEMY_SPEED_HALF, f"y_half should increment by {ENEMY_SPEED_HALF}"
 
-    def test_move_enemies_only_moves_alive_enemies(self):
+    def test_move_enemies_only_moves_alive_enemies(self, fresh_enemies):
         """Verify move_enemies only moves alive enemies, dead slots unchanged."""
-        state = create_enemy_state()
+        state = fresh_enemies
 
         # Set up alive and dead enemies
         state.enemy_alive[0] = True
@@ -350,14 +597,13 @@ class TestMoveEnemies:
         # Dead enemy should remain unchanged
         assert state.enemy_y_half[1] == 5, "Dead enemy should not move"
 
-    def test_move_enemies_moves_multiple_alive_enemies(self):
+    def test_move_enemies_moves_multiple_alive_enemies(self, fresh_enemies):
         """Verify move_enemies moves all alive enemies in single call."""
-        state = create_enemy_state()
+        state = fresh_enemies
 
         # Set up 3 alive enemies
-        for i in range(3):
-            state.enemy_alive[i] = True
-            state.enemy_y_half[i] = i * 2
+        state.enemy_alive[:3] = True
+        state.enemy_y_half[:3] = np.arange(0, 6, 2)
 
         move_enemies(state)
 
@@ -366,9 +612,9 @@ class TestMoveEnemies:
         assert state.enemy_y_half[1] == 3, "Enemy 1 should move"
         assert state.enemy_y_half[2] == 5, "Enemy 2 should move"
 
-    def test_move_enemies_in_place_mutation(self):
+    def test_move_enemies_in_place_mutation(self, fresh_enemies):
         """Verify move_enemies mutates state in-place (no return value)."""
-        state = create_enemy_state()
+        state = fresh_enemies
         state.enemy_alive[0] = True
         state.enemy_y_half[0] = 0
 
@@ -380,9 +626,23 @@ class TestMoveEnemies:
         # State should be mutated
         assert state.enemy_y_half[0] == 1, "State should be mutated in-place"
 
-    def test_move_enemies_multiple_calls_accumulate(self):
+    def test_move_enemies_interleaved_mask_writes_in_place(self, fresh_enemies):
+        """Verify an interleaved alive mask moves only alive slots, in place."""
+        state = fresh_enemies
+        y_half_before = state.enemy_y_half
+        state.enemy_alive[0:MAX_ENEMIES:3] = True
+        state.enemy_y_half[:] = np.arange(MAX_ENEMIES) % 8
+
+        expected = state.enemy_y_half + ENEMY_SPEED_HALF * state.enemy_alive
+        move_enemies(state)
+
+        assert state.enemy_y_half is y_half_before, "enemy_y_half should keep its identity"
+        assert state.enemy_y_half.dtype == ENEMY_POS_DTYPE, "dtype should stay int16"
+        assert np.array_equal(state.enemy_y_half, expected), "Only alive slots should move"
+
+    def test_move_enemies_multiple_calls_accumulate(self, fresh_enemies):
         """Verify multiple move_enemies calls accumulate movement."""
-        state = create_enemy_state()
+        state = fresh_enemies
         state.enemy_alive[0] = True
         state.enemy_y_half[0] = 0
 
@@ -403,27 +663,75 @@ class TestMoveEnemies:
 class TestCompactEnemies:
     """Test compact_enemies() function for array compaction."""
 
-    def test_compact_enemies_returns_zero_when_all_dead(self):
+    def test_compact_enemies_returns_zero_when_all_dead(self, fresh_enemies):
         """Verify compact_enemies returns 0 when no enemies alive."""
-        state = create_enemy_state()
+        state = fresh_enemies
         alive_count = compact_enemies(state)
         assert alive_count == 0, "Should have 0 alive enemies"
 
-    def test_compact_enemies_zero_pads_when_all_dead(self):
+    def test_compact_enemies_zero_pads_when_all_dead(self, fresh_enemies):
         """Verify compact_enemies zero-pads all arrays when all dead."""
-        state = create_enemy_state()
+        state = fresh_enemies
         compact_enemies(state)
 
         # All arrays should be zero
         assert not state.enemy_alive.any(), "All slots should be dead"
-        assert state.enemy_y_half.sum() == 0, "All y_half should be 0"
-        assert state.enemy_x.sum() == 0, "All x should be 0"
-        assert state.enemy_type.sum() == 0, "All types should be 0"
-        assert state.enemy_spawn_tick.sum() == 0, "All spawn ticks should be 0"
+        assert not state.enemy_y_half.any(), "All y_half should be 0"
+        assert not state.enemy_x.any(), "All x should be 0"
+        assert not state.enemy_type.any(), "All types should be 0"
+        assert not state.enemy_spawn_tick.any(), "All spawn ticks should be 0"
+
+    def test_compact_enemies_zeroes_stale_tail_of_alive_prefix(self, fresh_enemies):
+        """Verify a trailing death is zero-padded even when no slot moves."""
+        state = fresh_enemies
+        place_enemies(state, np.array([4, 6, 8]), np.array([1, 2, 3]), current_tick=5)
+        state.enemy_alive[2] = False  # Last alive slot dies, data left behind
+
+        alive_count = compact_enemies(state)
+
+        assert alive_count == 2, "Should have 2 alive enemies"
+        assert state.enemy_y_half[2] == 0 and state.enemy_x[2] == 0, "Dead slot should be zeroed"
+        assert state.enemy_spawn_tick[2] == 0, "Dead slot spawn tick should be zeroed"
+        assert np.array_equal(state.enemy_y_half[:2], [4, 6]), "Alive prefix should not move"
+
+    def test_compact_enemies_zeroes_tail_dirty_in_one_field(self, fresh_enemies):
+        """Verify a tail dirty in any single field is zero-padded."""
+        state = fresh_enemies
+        place_enemies(state, np.array([4, 6]), np.array([1, 2]), current_tick=5)
+
+        for field in ("enemy_y_half", "enemy_x", "enemy_type", "enemy_spawn_tick"):
+            getattr(state, field)[MAX_ENEMIES - 1] = 3
+
+            compact_enemies(state)
+
+            assert getattr(state, field)[MAX_ENEMIES - 1] == 0, f"{field} tail not zeroed"
 
-    def test_compact_enemies_preserves_order_when_all_alive(self):
+    def test_compact_enemies_sorts_alive_prefix_by_spawn_tick(self, fresh_enemies):
+        """Verify an alive prefix out of spawn order is still sorted."""
+        state = fresh_enemies
+        state.enemy_alive[:3] = True
+        state.enemy_spawn_tick[:3] = [30, 10, 20]
+        state.enemy_y_half[:3] = [3, 1, 2]
+
+        compact_enemies(state)
+
+        assert np.array_equal(state.enemy_spawn_tick[:3], [10, 20, 30]), "Ticks should be sorted"
+        assert np.array_equal(state.enemy_y_half[:3], [1, 2, 3]), "Fields should move with ticks"
+
+    def test_count_alive_matches_count_nonzero(self, fresh_enemies):
+        """Verify count_alive agrees with np.count_nonzero over any prefix."""
+        state = fresh_enemies
+        state.enemy_alive[[0, 3, 4, 11, MAX_ENEMIES - 1]] = True
+
+        for stop in (0, 1, 4, 5, 12, MAX_ENEMIES):
+            assert count_alive(state, stop) == np.count_nonzero(
+                state.enemy_alive[:stop]
+            ), f"Alive count below slot {stop} mismatch"
+        assert count_alive(state) == 5, "Default should count every slot"
+
+    def test_compact_enemies_preserves_order_when_all_alive(self, fresh_enemies):
         """Verify compact_enemies preserves order when all enemies alive."""
-        state = create_enemy_state()
+        state = fresh_enemies
         rng = np.random.default_rng(42)
 
         # Spawn 5 enemies at different ticks
@@ -442,9 +750,9 @@ class TestCompactEnemies:
             state.enemy_spawn_tick[:5], original_spawn_ticks
         ), "Order should be preserved"
 
-    def test_compact_enemies_sorts_by_spawn_tick_oldest_first(self):
+    def test_compact_enemies_sorts_by_spawn_tick_oldest_first(self, fresh_enemies):
         """Verify compact_enemies sorts alive enemies by spawn_tick (oldest first)."""
-        state = create_enemy_state()
+        state = fresh_enemies
         rng = np.random.default_rng(42)
 
         # Spawn 3 enemies at different ticks
@@ -462,9 +770,9 @@ class TestCompactEnemies:
         assert state.enemy_spawn_tick[0] == 100, "Slot 0 should have oldest (tick 100)"
         assert state.enemy_spawn_tick[1] == 150, "Slot 1 should have second-oldest (tick 150)"
 
-    def test_compact_enemies_shifts_alive_to_front(self):
+    def test_compact_enemies_shifts_alive_to_front(self, fresh_enemies):
         """Verify compact_enemies shifts alive enemies to front of arrays."""
-        state = create_enemy_state()
+        state = fresh_enemies
         rng = np.random.default_rng(42)
 
         # Spawn 3 enemies
@@ -479,13 +787,13 @@ class TestCompactEnemies:
         alive_count = compact_enemies(state)
 
         assert alive_count == 2, "Should have 2 alive enemies"
-        assert state.enemy_alive[0] == True, "Slot 0 should be alive"
-        assert state.enemy_alive[1] == True, "Slot 1 should be alive"
+        assert state.enemy_alive[0], "Slot 0 should be alive"
+        assert state.enemy_alive[1], "Slot 1 should be alive"
         assert not state.enemy_alive[2:].any(), "Slots 2-19 should be dead"
 
-    def test_compact_enemies_zero_pads_trailing_slots(self):
+    def test_compact_enemies_zero_pads_trailing_slots(self, fresh_enemies):
         """Verify compact_enemies zero-pads trailing slots after alive enemies."""
-        state = create_enemy_state()
+        state = fresh_enemies
         rng = np.random.default_rng(42)
 
         # Spawn 3 enemies
@@ -501,14 +809,14 @@ class TestCompactEnemies:
 
         # Trailing slots should be zero-padded
         assert not state.enemy_alive[alive_count:].any(), "Trailing slots should be dead"
-        assert state.enemy_y_half[alive_count:].sum() == 0, "Trailing y_half should be 0"
-        assert state.enemy_x[alive_count:].sum() == 0, "Trailing x should be 0"
-        assert state.enemy_type[alive_count:].sum() == 0, "Trailing types should be 0"
-        assert state.enemy_spawn_tick[alive_count:].sum() == 0, "Trailing spawn ticks should be 0"
+        assert not state.enemy_y_half[alive_count:].any(), "Trailing y_half should be 0"
+        assert not state.enemy_x[alive_count:].any(), "Trailing x should be 0"
+        assert not state.enemy_type[alive_count:].any(), "Trailing types should be 0"
+        assert not state.enemy_spawn_tick[alive_count:].any(), "Trailing spawn ticks should be 0"
 
-    def test_compact_enemies_handles_multiple_dead_slots(self):
+    def test_compact_enemies_handles_multiple_dead_slots(self, fresh_enemies):
         """Verify compact_enemies handles multiple dead slots correctly."""
-        state = create_enemy_state()
+        state = fresh_enemies
         rng = np.random.default_rng(42)
 
         # Spawn 5 enemies
@@ -523,13 +831,13 @@ class TestCompactEnemies:
         alive_count = compact_enemies(state)
 
         assert alive_count == 3, "Should have 3 alive enemies"
-        expected_ticks = [0, 20, 40]
-        actual_ticks = sorted(state.enemy_spawn_tick[:3].tolist())
-        assert actual_ticks == expected_ticks, f"Expected {expected_ticks}, got {actual_ticks}"
+        assert np.array_equal(
+            state.enemy_spawn_tick[:3], [0, 20, 40]
+        ), f"Expected ticks [0, 20, 40] in order, got {state.enemy_spawn_tick[:3]}"
 
-    def test_compact_enemies_stable_sort_preserves_order(self):
+    def test_compact_enemies_stable_sort_preserves_order(self, fresh_enemies):
         """Verify compact_enemies uses stable sort for same-tick spawns."""
-        state = create_enemy_state()
+        state = fresh_enemies
         rng = np.random.default_rng(42)
 
         # Spawn 3 enemies at same tick
@@ -547,9 +855,36 @@ class TestCompactEnemies:
         assert state.enemy_spawn_tick[0] == 100, "Slot 0 should have tick 100"
         assert state.enemy_spawn_tick[1] == 100, "Slot 1 should have tick 100"
 
-    def test_compact_enemies_full_capacity(self):
+    def test_compact_enemies_matches_stable_sort_reference(self):
+        """Verify compact_enemies matches a stable sort by (dead, spawn_tick)."""
+        rng = np.random.default_rng(7)
+
+        for _ in range(50):
+            state = create_enemy_state()
+            state.enemy_alive[:] = rng.random(MAX_ENEMIES) < 0.6
+            state.enemy_y_half[:] = rng.integers(0, 18, MAX_ENEMIES)
+            state.enemy_x[:] = rng.integers(0, WIDTH, MAX_ENEMIES)
+            state.enemy_spawn_tick[:] = rng.integers(0, 8, MAX_ENEMIES)
+            expected_alive = int(np.count_nonzero(state.enemy_alive))
+            key = (~state.enemy_alive, state.enemy_spawn_tick)
+            order = np.lexsort(key[::-1])[:expected_alive]
+            expected_y = state.enemy_y_half[order].copy()
+            expected_x = state.enemy_x[order].copy()
+            expected_ticks = state.enemy_spawn_tick[order].copy()
+
+            alive_count = compact_enemies(state)
+
+            assert alive_count == expected_alive, "Alive count mismatch"
+            assert np.array_equal(state.enemy_y_half[:alive_count], expected_y)
+            assert np.array_equal(state.enemy_x[:alive_count], expected_x)
+            assert np.array_equal(
+                state.enemy_spawn_tick[:alive_count], expected_ticks
+            ), "Alive slots should be stably ordered by spawn_tick"
+            assert not state.enemy_alive[alive_count:].any(), "Tail should be dead"
+
+    def test_compact_enemies_full_capacity(self, fresh_enemies):
         """Verify compact_enemies works correctly with all 20 slots."""
-        state = create_enemy_state()
+        state = fresh_enemies
         rng = np.random.default_rng(42)
 
         # Fill all 20 slots
@@ -566,6 +901,51 @@ class TestCompactEnemies:
         assert state.enemy_alive[:19].all(), "First 19 slots should be alive"
         assert not state.enemy_alive[19], "Slot 19 should be dead"
 
+    def test_compact_enemies_full_capacity_still_orders_by_tick(self, fresh_enemies):
+        """Verify an all-alive state is not returned early when out of tick order."""
+        state = fresh_enemies
+        ticks = np.arange(MAX_ENEMIES)[::-1]
+        place_enemies(state, ticks, ticks % WIDTH, current_tick=0)
+        state.enemy_spawn_tick[:] = ticks
+
+        alive_count = compact_enemies(state)
+
+        assert alive_count == MAX_ENEMIES, "All slots should stay alive"
+        assert np.array_equal(
+            state.enemy_spawn_tick, np.arange(MAX_ENEMIES)
+        ), "Full state should still be sorted oldest first"
+        assert np.array_equal(state.enemy_y_half, np.arange(MAX_ENEMIES)), "Fields should move with ticks"
+
+    def test_compact_enemies_writes_in_place(self, fresh_enemies):
+        """Verify compact_enemies reorders data without rebinding arrays."""
+        state = fresh_enemies
+        rng = np.random.default_rng(42)
+
+        for tick in (0, 10, 20):
+            spawn_enemy(state, current_tick=tick, rng=rng)
+        state.enemy_alive[0] = False
+
+        arrays_before = (
+            state.enemy_y_half,
+            state.enemy_x,
+            state.enemy_alive,
+            state.enemy_type,
+            state.enemy_spawn_tick,
+        )
+
+        compact_enemies(state)
+
+        arrays_after = (
+            state.enemy_y_half,
+            state.enemy_x,
+            state.enemy_alive,
+            state.enemy_type,
+            state.enemy_spawn_tick,
+        )
+        for before, after in zip(arrays_before, arrays_after):
+            assert after is before, "compact_enemies should not rebind arrays"
+        assert state.enemy_spawn_tick[0] == 10, "Slot 0 should have tick 10"
+
 
 # =============================================================================
 # Half-Cell Conversion Tests
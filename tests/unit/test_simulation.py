@@ -29,10 +29,49 @@ Audience
 - **QA Engineers**: Validating RNG isolation and reproducibility guarantees
 """
 
+from functools import lru_cache
+
 import numpy as np
+import pytest
 
 from src.core import create_simulation_state, step
-from src.core.constants import NO_OP_ACTION
+from src.core.constants import NO_OP_ACTION, NUM_ACTIONS
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def bit_identical(a: np.ndarray, b: np.ndarray) -> bool:
+    """
+    Return True if two arrays have the same dtype, shape and raw bytes.
+
+    Determinism checks want bit-for-bit equality, so compare the raw byte
+    images (one memcmp, no bool temporary) rather than np.array_equal,
+    which builds an elementwise mask and reduces it. The dtype and shape
+    guards keep differently typed or shaped arrays from comparing equal
+    just because their bytes happen to match.
+    """
+    return a.dtype == b.dtype and a.shape == b.shape and a.tobytes() == b.tobytes()
+
+
+@lru_cache(maxsize=None)
+def baseline_enemy_positions(seed: int, n_steps: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return (enemy_x, enemy_y_half) after n_steps NO-OP steps run in isolation.
+
+    A baseline is a pure function of (seed, n_steps), so it is simulated
+    once per session and shared. The cached arrays are read-only copies,
+    so no caller can alter the baseline another test compares against.
+    """
+    sim = create_simulation_state(seed=seed)
+    for _ in range(n_steps):
+        step(sim, action=NO_OP_ACTION)
+
+    positions = (sim.enemy_state.enemy_x.copy(), sim.enemy_state.enemy_y_half.copy())
+    for arr in positions:
+        arr.setflags(write=False)
+    return positions
 
 # =============================================================================
 # TestSimulationStateFactory
@@ -240,7 +279,33 @@ class TestStepRNGUsage:
         spawn_col = sim.enemy_state.enemy_x[alive_mask][0]
         assert 0 <= spawn_col < 13, f"Spawn column {spawn_col} should be in range [0, 12]"
 
-    def test_same_seed_same_trajectory(self):
+    def test_step_draws_one_column_per_spawn(self):
+        """
+        Verify that step() advances sim_state.rng by exactly one draw per spawn.
+
+        Spawn columns are drawn on demand, not prefetched into a buffer, so
+        after a spawn tick sim.rng is in the same state as a fresh generator
+        with the same seed that made one integers(0, WIDTH) draw. Code that
+        shares sim.rng therefore sees the same stream it would without step().
+        """
+        sim = create_simulation_state(seed=42)
+        reference = np.random.default_rng(42)
+
+        step(sim, action=NO_OP_ACTION)  # Tick 0 spawns
+        expected_col = reference.integers(0, 13)
+
+        assert sim.enemy_state.enemy_x[0] == expected_col, "Column should be the next draw"
+        assert (
+            sim.rng.bit_generator.state == reference.bit_generator.state
+        ), "A spawn should consume exactly one draw from sim.rng"
+
+        step(sim, action=NO_OP_ACTION)  # Tick 1 does not spawn
+        assert (
+            sim.rng.bit_generator.state == reference.bit_generator.state
+        ), "A tick without a spawn should not advance sim.rng"
+
+    @pytest.mark.parametrize("seed", [42, 123, 7, 2024])
+    def test_same_seed_same_trajectory(self, seed):
         """
         Verify that same seed + same actions produce identical trajectory.
 
@@ -266,9 +331,10 @@ class TestStepRNGUsage:
         ...                sim2.enemy_state.enemy_y_half)
         True
         """
-        # Create two simulations with same seed
-        sim1 = create_simulation_state(seed=42)
-        sim2 = create_simulation_state(seed=42)
+        # Create two simulations with same seed (each case builds its own
+        # pair, so cases share no state and can run on separate workers)
+        sim1 = create_simulation_state(seed=seed)
+        sim2 = create_simulation_state(seed=seed)
 
         # Execute identical action sequences
         actions = [NO_OP_ACTION] * 10  # 10 NO-OP steps
@@ -282,11 +348,11 @@ class TestStepRNGUsage:
             rewards2.append(r2)
 
         # Verify identical enemy positions
-        assert np.array_equal(
+        assert bit_identical(
             sim1.enemy_state.enemy_y_half, sim2.enemy_state.enemy_y_half
         ), "Same seed + same actions should produce identical enemy_y_half"
 
-        assert np.array_equal(
+        assert bit_identical(
             sim1.enemy_state.enemy_x, sim2.enemy_state.enemy_x
         ), "Same seed + same actions should produce identical enemy_x"
 
@@ -387,38 +453,43 @@ class TestRNGIsolation:
         - Global state: np.random global RNG (legacy)
         - Local state: sim_state.rng (modern Generator)
         - Isolation: sim_state.rng operations should not affect global
-        - Verification: Compare global state before and after
+        - Verification: Snapshot the global state before and after and
+          compare exactly; nothing is drawn from the global RNG, so the
+          test neither perturbs nor depends on its sequence
+        - Sanity: the local RNG state must have moved, so the run really
+          exercised a spawn draw
 
         Examples
         --------
-        >>> val_before = np.random.randint(0, 100)
+        >>> before = np.random.get_state()
         >>> sim = create_simulation_state(seed=42)
         >>> for _ in range(10):
         ...     step(sim, action=0)
-        >>> val_after = np.random.randint(0, 100)
-        >>> # Global RNG sequence should continue uninterrupted
+        >>> after = np.random.get_state()
+        >>> # Global RNG state should be untouched
         """
-        # Sample from global RNG before simulation
-        global_val_before = np.random.randint(0, 1000)
+        # Snapshot the global RNG state (no draw, so the sequence is untouched)
+        name_before, key_before, *rest_before = np.random.get_state()
 
         # Run simulation steps (which use internal RNG)
         sim = create_simulation_state(seed=42)
+        local_before = sim.rng.bit_generator.state
         for _ in range(10):
             step(sim, action=NO_OP_ACTION)
 
-        # Sample from global RNG after simulation
-        global_val_after = np.random.randint(0, 1000)
-
-        # Verify global RNG state unchanged by checking that the sequence
-        # continues as if simulation never happened
-        # Note: This is a probabilistic test, but with 1000 possible values,
-        # the probability of collision is 0.001
-        assert global_val_before != global_val_after, (
-            "Global RNG should continue its sequence uninterrupted. "
-            "If this test fails, it's extremely unlikely (p=0.001) "
-            "but possible due to random collision."
+        name_after, key_after, *rest_after = np.random.get_state()
+
+        # The tick-0 spawn must have drawn from the simulation's own RNG,
+        # otherwise an unchanged global state would prove nothing
+        assert sim.rng.bit_generator.state != local_before, (
+            "Simulation RNG should have advanced (spawn draw)"
         )
 
+        # Verify the global RNG state is bit-for-bit unchanged
+        assert name_before == name_after, "Global RNG algorithm should be unchanged"
+        assert bit_identical(key_before, key_after), "Global RNG key should be unchanged"
+        assert rest_before == rest_after, "Global RNG position should be unchanged"
+
     def test_independent_rng_per_simulation(self):
         """
         Verify that multiple simulations maintain independent RNG states.
@@ -452,35 +523,133 @@ class TestRNGIsolation:
         sim1 = create_simulation_state(seed=42)
         sim2 = create_simulation_state(seed=123)
 
-        # Create independent baselines (run separately)
-        baseline1 = create_simulation_state(seed=42)
-        baseline2 = create_simulation_state(seed=123)
-
         # Run interleaved steps on sim1 and sim2
         for _ in range(5):
             step(sim1, action=NO_OP_ACTION)
             step(sim2, action=NO_OP_ACTION)
 
-        # Run same steps on baselines (non-interleaved)
-        for _ in range(5):
-            step(baseline1, action=NO_OP_ACTION)
-        for _ in range(5):
-            step(baseline2, action=NO_OP_ACTION)
+        # Independent baselines (each seed run on its own, cached per session)
+        baseline1_x, baseline1_y_half = baseline_enemy_positions(42, 5)
+        baseline2_x, baseline2_y_half = baseline_enemy_positions(123, 5)
+
+        # Bind the compared arrays once rather than walking sim.enemy_state
+        # in every assertion
+        sim1_enemies, sim2_enemies = sim1.enemy_state, sim2.enemy_state
+        sim1_x, sim1_y_half = sim1_enemies.enemy_x, sim1_enemies.enemy_y_half
+        sim2_x, sim2_y_half = sim2_enemies.enemy_x, sim2_enemies.enemy_y_half
 
         # Verify sim1 matches baseline1 (independent execution)
-        assert np.array_equal(
-            sim1.enemy_state.enemy_x, baseline1.enemy_state.enemy_x
+        assert bit_identical(
+            sim1_x, baseline1_x
         ), "Interleaved sim1 should match non-interleaved baseline1"
 
-        assert np.array_equal(
-            sim1.enemy_state.enemy_y_half, baseline1.enemy_state.enemy_y_half
+        assert bit_identical(
+            sim1_y_half, baseline1_y_half
         ), "Interleaved sim1 should match non-interleaved baseline1"
 
         # Verify sim2 matches baseline2 (independent execution)
-        assert np.array_equal(
-            sim2.enemy_state.enemy_x, baseline2.enemy_state.enemy_x
+        assert bit_identical(
+            sim2_x, baseline2_x
         ), "Interleaved sim2 should match non-interleaved baseline2"
 
-        assert np.array_equal(
-            sim2.enemy_state.enemy_y_half, baseline2.enemy_state.enemy_y_half
+        assert bit_identical(
+            sim2_y_half, baseline2_y_half
         ), "Interleaved sim2 should match non-interleaved baseline2"
+
+
+# =============================================================================
+# TestGridOccupancyInvariant
+# =============================================================================
+
+
+class TestGridOccupancyInvariant:
+    """
+    Tests that the grid occupancy plane stays consistent with wall flags.
+
+    GridState.grid is kept as its own int8 plane (it is a separate observation
+    channel and the O(1) occupancy check in place_wall), but it carries no
+    information beyond wall_armed | wall_pending. These tests pin that
+    invariant across full simulation trajectories so the redundant plane can
+    never drift from the flags it mirrors.
+
+    Technical Details
+    -----------------
+    - Invariant: grid == (wall_armed | wall_pending) after every step
+    - Exercised paths: place_wall, arm_pending_walls, resolve_collisions
+    - Action stream: seeded random placements mixed with NO-OPs
+    """
+
+    def test_grid_matches_wall_flags_every_tick(self):
+        """Verify grid mirrors wall_armed | wall_pending after every step."""
+        action_rng = np.random.default_rng(7)
+        sim = create_simulation_state(seed=7)
+
+        # Restart on termination (stepping past a breach is not supported),
+        # so the run covers many placements, arms and wall destructions
+        for tick in range(600):
+            action = int(action_rng.integers(0, NUM_ACTIONS))
+            _, terminated, _ = step(sim, action=action)
+
+            grid_state = sim.grid_state
+            occupied = grid_state.wall_armed | grid_state.wall_pending
+            assert np.array_equal(
+                grid_state.grid != 0, occupied
+            ), f"grid diverged from wall flags at tick {sim.tick}"
+
+            if terminated:
+                sim = create_simulation_state(seed=tick)
+
+
+# =============================================================================
+# TestBufferReuse
+# =============================================================================
+
+
+class TestBufferReuse:
+    """
+    Tests that step() works in preallocated buffers instead of rebinding.
+
+    The per-tick kernels write into arrays allocated once by the factories
+    (collision_out for the collision mask, the enemy field block for
+    movement, spawning and compaction, the grid planes for placement,
+    arming, damage and cooldowns). A kernel that rebinds one of them would
+    silently reintroduce a per-tick allocation, so this pins the identity of
+    every state array across a trajectory.
+    """
+
+    def test_state_arrays_keep_identity_across_steps(self):
+        """Verify no state array is rebound over a full random trajectory."""
+        action_rng = np.random.default_rng(11)
+        sim = create_simulation_state(seed=11)
+        owners = {"enemy_state": sim.enemy_state, "grid_state": sim.grid_state}
+
+        # Every array field, keyed by (owner, name) so no lookup is ambiguous
+        fields = [
+            ("enemy_state", "enemy_y_half"),
+            ("enemy_state", "enemy_x"),
+            ("enemy_state", "enemy_alive"),
+            ("enemy_state", "enemy_type"),
+            ("enemy_state", "enemy_spawn_tick"),
+            ("enemy_state", "collision_out"),
+            ("grid_state", "grid"),
+            ("grid_state", "wall_hp"),
+            ("grid_state", "wall_armed"),
+            ("grid_state", "wall_pending"),
+            ("grid_state", "cell_cd"),
+            ("grid_state", "wall_armed_flat"),
+        ]
+        buffers = {
+            (owner, name): getattr(owners[owner], name) for owner, name in fields
+        }
+
+        for _ in range(300):
+            _, terminated, _ = step(sim, action=int(action_rng.integers(0, NUM_ACTIONS)))
+            if terminated:
+                break
+
+        for owner, state in owners.items():
+            assert getattr(sim, owner) is state, f"sim.{owner} should not be rebound"
+        for (owner, name), buffer in buffers.items():
+            assert (
+                getattr(owners[owner], name) is buffer
+            ), f"{owner}.{name} should not be rebound"